@@ -8,9 +8,23 @@ __description__ = "High-performance Rubik's Cube solver with multiple algorithms
 
 from cube.cube import Cube
 from cube.moves import Move, MoveCommand
-from solvers.bfs_solver import BFSSolver
-from solvers.ida_solver import IDASolver
-from solvers.kociemba_wrapper import KociembaWrapper
+
+# Solvers are imported on first access so that importing the package does
+# not pay for every solver module up front.
+_LAZY_SOLVERS = {
+    'BFSSolver': 'solvers.bfs_solver',
+    'IDASolver': 'solvers.ida_solver',
+    'KociembaWrapper': 'solvers.kociemba_wrapper',
+}
+
+
+def __getattr__(name: str):
+    """Import solver classes lazily."""
+    if name in _LAZY_SOLVERS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_SOLVERS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'Cube',
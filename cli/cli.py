@@ -7,17 +7,22 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from cube.cube import Cube
-from solvers.bfs_solver import BFSSolver
-from solvers.ida_solver import IDASolver
-from solvers.kociemba_wrapper import KociembaWrapper
+if TYPE_CHECKING:
+    from cube.cube import Cube
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False  # type: ignore
 
-def load_cube_from_file(filepath: str) -> Cube:
+
+def load_cube_from_file(filepath: str) -> "Cube":
     """
     Load cube state from a JSON file.
     
@@ -40,12 +45,16 @@ def load_cube_from_file(filepath: str) -> Cube:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    with open(path, 'r') as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
     
     if 'state' not in data:
         raise ValueError("JSON must contain 'state' key")
     
+    from cube.cube import Cube
     return Cube(data['state'])
 
 
@@ -68,8 +77,11 @@ def save_solution(moves: list[str], nodes_explored: int, output_file: str) -> No
     path = Path(output_file)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w') as f:
-        json.dump(solution, f, indent=2)
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(solution, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(solution, f, indent=2)
     
     print(f"Solution saved to {output_file}")
 
@@ -139,6 +151,10 @@ Examples:
     
     args = parser.parse_args()
     
+    # Imported after argument parsing: loading the move kernels (and Numba,
+    # when installed) is most of the startup cost, and --help doesn't need it.
+    from cube.cube import Cube
+    
     # Load cube state
     try:
         if args.state:
@@ -159,17 +175,20 @@ Examples:
         save_solution([], 1, args.output)
         return
     
-    # Select solver
+    # Select solver (imported here so only the chosen one is loaded)
     try:
         if args.method == 'bfs':
+            from solvers.bfs_solver import BFSSolver
             solver = BFSSolver()
             if args.verbose:
                 print("Using BFS solver...")
         elif args.method == 'ida':
+            from solvers.ida_solver import IDASolver
             solver = IDASolver(heuristic=args.heuristic)
             if args.verbose:
                 print(f"Using IDA* solver with '{args.heuristic}' heuristic...")
         else:  # kociemba
+            from solvers.kociemba_wrapper import KociembaWrapper
             solver = KociembaWrapper(fallback_to_ida=True)
             if args.verbose:
                 print("Using Kociemba solver (with IDA* fallback)...")
@@ -0,0 +1,106 @@
+"""
+Compiled move kernels for the sticker array.
+
+Uses Numba when it is installed (pip install numba); otherwise falls back to
+NumPy implementations with the same signatures and results.
+
+``permute_inplace_hashed`` exists only with Numba: in NumPy a per-move hash
+update costs more than the move, so ``Cube`` rehashes lazily instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False  # type: ignore
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, boundscheck=False)
+    def permute_inplace_hashed(state, perm, scratch, zobrist, h):  # type: ignore
+        """
+        Permute ``state`` in place by ``perm`` and return the updated Zobrist hash.
+
+        Only stickers whose color changes touch the hash ``h`` (a ``uint64``).
+        """
+        for i in range(54):
+            scratch[i] = state[perm[i]]
+        for i in range(54):
+            old = state[i]
+            new = scratch[i]
+            if old != new:
+                h ^= zobrist[i, old] ^ zobrist[i, new]
+                state[i] = new
+        return h
+
+    @njit(cache=True, boundscheck=False)
+    def apply_move_hashed(src, dst, perm, zobrist, h):  # type: ignore
+        """
+        Write ``src`` permuted by ``perm`` into ``dst`` and return its Zobrist hash.
+
+        ``h`` (a ``uint64``) is the hash of ``src``; ``dst`` must not alias ``src``.
+        """
+        for i in range(54):
+            old = src[i]
+            new = src[perm[i]]
+            dst[i] = new
+            if old != new:
+                h ^= zobrist[i, old] ^ zobrist[i, new]
+        return h
+
+    @njit(cache=True, boundscheck=False)
+    def apply_sequence(src, out, perms, seq):  # type: ignore
+        """
+        Apply the move ids in ``seq`` to ``src``, writing the result into ``out``.
+
+        ``out`` may be ``src`` itself.
+        """
+        buf = src.copy()
+        for k in range(seq.shape[0]):
+            perm = perms[seq[k]]
+            for i in range(54):
+                out[i] = buf[perm[i]]
+            for i in range(54):
+                buf[i] = out[i]
+        for i in range(54):
+            out[i] = buf[i]
+
+else:
+
+    def apply_move_hashed(  # type: ignore
+        src: np.ndarray,
+        dst: np.ndarray,
+        perm: np.ndarray,
+        zobrist: np.ndarray,
+        h: np.uint64
+    ) -> int:
+        """
+        Write ``src`` permuted by ``perm`` into ``dst`` and return its Zobrist hash.
+
+        ``h`` (a ``uint64``) is the hash of ``src``; ``dst`` must not alias ``src``.
+        """
+        np.take(src, perm, out=dst)
+        changed = np.flatnonzero(dst != src)
+        h ^= np.bitwise_xor.reduce(zobrist[changed, src[changed]])
+        h ^= np.bitwise_xor.reduce(zobrist[changed, dst[changed]])
+        return int(h)
+
+    def apply_sequence(  # type: ignore
+        src: np.ndarray,
+        out: np.ndarray,
+        perms: np.ndarray,
+        seq: np.ndarray
+    ) -> None:
+        """
+        Apply the move ids in ``seq`` to ``src``, writing the result into ``out``.
+
+        ``out`` may be ``src`` itself.
+        """
+        # Compose the whole sequence first so the stickers are gathered once.
+        perm = np.arange(54)
+        for move_id in seq:
+            perm = perm[perms[move_id]]
+        out[:] = src[perm]
@@ -16,41 +16,305 @@ Each face is indexed as:
 
 Example:
     WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYY
+
+Internally the stickers are held in a uint8 NumPy array of color ids
+(see ``COLORS``); the string form is only built when requested.
 """
 
 from typing import Any
 
+import numpy as np
+
+from ._fastmoves import HAS_NUMBA, apply_sequence as _apply_sequence
+
+if HAS_NUMBA:
+    from ._fastmoves import permute_inplace_hashed
+
+# Color letters in face order: color id i is the color of a solved face i.
+COLORS = "WOGRBY"
+
+# ASCII code -> color id lookup (255 marks bytes that are not a color).
+_ENCODE = np.full(256, 255, dtype=np.uint8)
+_ENCODE[np.frombuffer(COLORS.encode("ascii"), dtype=np.uint8)] = np.arange(6, dtype=np.uint8)
+
+# Deletes every color letter; anything left over is an invalid character.
+_STRIP_COLORS = str.maketrans("", "", COLORS)
+_COLOR_BYTES = COLORS.encode("ascii")
+
+# Color id -> ASCII code lookup.
+_DECODE = np.frombuffer(COLORS.encode("ascii"), dtype=np.uint8)
+
+# Gather indices for rotating a single 9-sticker face.
+_FACE_CW = np.array([6, 3, 0, 7, 4, 1, 8, 5, 2], dtype=np.intp)
+_FACE_CCW = np.array([2, 5, 8, 1, 4, 7, 0, 3, 6], dtype=np.intp)
+_FACE_180 = _FACE_CW[_FACE_CW]
+
+
+def _encode(state: str | bytes | bytearray) -> np.ndarray:
+    """Convert a color string (or its ASCII bytes) to an array of color ids."""
+    if isinstance(state, str):
+        state = state.encode("ascii")
+    return _ENCODE[np.frombuffer(state, dtype=np.uint8)]
+
+
+def _decode(stickers: np.ndarray) -> str:
+    """Convert an array of color ids back to a color string."""
+    return _DECODE[stickers].tobytes().decode("ascii")
+
+
+# Zobrist keys: one random 64-bit value per (sticker position, color id).
+ZOBRIST = np.random.default_rng(0xC0DE).integers(0, 2**64, size=(54, 6), dtype=np.uint64)
+ZOBRIST.flags.writeable = False
+_POSITIONS = np.arange(54)
+
+
+def zobrist_hash(stickers: np.ndarray) -> np.ndarray:
+    """
+    Compute the Zobrist hash of sticker arrays from scratch.
+
+    Args:
+        stickers (np.ndarray): Color ids with shape (..., 54).
+
+    Returns:
+        np.ndarray: ``uint64`` hashes with shape (...).
+    """
+    return np.bitwise_xor.reduce(ZOBRIST[_POSITIONS, stickers], axis=-1)
+
+
+def _move_perm(
+    face_idx: int,
+    edges: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...]
+) -> np.ndarray:
+    """
+    Build the 54-element gather permutation for a clockwise face turn.
+
+    Applying the move is ``new = old[perm]``.
+
+    Args:
+        face_idx (int): Face being turned (its stickers rotate clockwise).
+        edges: (destination, source) index triples for the adjacent stickers.
+
+    Returns:
+        np.ndarray: Permutation array of length 54.
+    """
+    perm = np.arange(54, dtype=np.intp)
+    start = face_idx * 9
+    perm[start:start + 9] = start + _FACE_CW
+    for dst, src in edges:
+        perm[list(dst)] = src
+    return perm
+
+
+_PERM_U = _move_perm(0, (
+    ((18, 19, 20), (27, 28, 29)),  # Front gets Right
+    ((9, 10, 11), (18, 19, 20)),   # Left gets Front
+    ((36, 37, 38), (9, 10, 11)),   # Back gets Left
+    ((27, 28, 29), (36, 37, 38)),  # Right gets Back
+))
+_PERM_D = _move_perm(5, (
+    ((24, 25, 26), (15, 16, 17)),  # Front gets Left
+    ((15, 16, 17), (42, 43, 44)),  # Left gets Back
+    ((42, 43, 44), (33, 34, 35)),  # Back gets Right
+    ((33, 34, 35), (24, 25, 26)),  # Right gets Front
+))
+_PERM_R = _move_perm(3, (
+    ((20, 23, 26), (47, 50, 53)),  # Front gets Down
+    ((2, 5, 8), (20, 23, 26)),     # Up gets Front
+    ((38, 41, 44), (2, 5, 8)),     # Back gets Up
+    ((47, 50, 53), (38, 41, 44)),  # Down gets Back
+))
+_PERM_L = _move_perm(1, (
+    ((18, 21, 24), (0, 3, 6)),     # Front gets Up
+    ((0, 3, 6), (36, 39, 42)),     # Up gets Back
+    ((36, 39, 42), (45, 48, 51)),  # Back gets Down
+    ((45, 48, 51), (18, 21, 24)),  # Down gets Front
+))
+_PERM_F = _move_perm(2, (
+    ((6, 7, 8), (17, 14, 11)),     # Up gets Left (reversed)
+    ((33, 34, 35), (6, 7, 8)),     # Right gets Up
+    ((47, 46, 45), (33, 34, 35)),  # Down (reversed) gets Right
+    ((17, 14, 11), (47, 46, 45)),  # Left gets Down
+))
+_PERM_B = _move_perm(4, (
+    ((0, 3, 6), (33, 30, 27)),     # Up gets Right (reversed)
+    ((9, 10, 11), (0, 3, 6)),      # Left gets Up
+    ((53, 50, 47), (9, 10, 11)),   # Down (reversed) gets Left
+    ((33, 30, 27), (53, 50, 47)),  # Right gets Down
+))
+
+
+# Move ids, in the order used by ``MOVE_NAMES`` and ``MOVE_PERMS``.
+(MOVE_U, MOVE_U_PRIME, MOVE_U2,
+ MOVE_D, MOVE_D_PRIME, MOVE_D2,
+ MOVE_L, MOVE_L_PRIME, MOVE_L2,
+ MOVE_R, MOVE_R_PRIME, MOVE_R2,
+ MOVE_F, MOVE_F_PRIME, MOVE_F2,
+ MOVE_B, MOVE_B_PRIME, MOVE_B2) = range(18)
+
+MOVE_NAMES = ("U", "U'", "U2", "D", "D'", "D2",
+              "L", "L'", "L2", "R", "R'", "R2",
+              "F", "F'", "F2", "B", "B'", "B2")
+
+# Id of the move that undoes each move (X <-> X', X2 <-> X2).
+MOVE_INVERSE = tuple(m + (1, -1, 0)[m % 3] for m in range(18))
+
+
+def _build_move_perms() -> np.ndarray:
+    """
+    Build the gather permutation of every move.
+
+    The half turn is the quarter turn composed with itself and the
+    counterclockwise turn is its inverse, both derived here once so that
+    applying any move costs a single gather.
+
+    Returns:
+        np.ndarray: Array of shape (18, 54), one row per move id.
+    """
+    perms = np.empty((18, 54), dtype=np.intp)
+    quarters = (_PERM_U, _PERM_D, _PERM_L, _PERM_R, _PERM_F, _PERM_B)
+    for face, quarter in enumerate(quarters):
+        perms[3 * face] = quarter
+        perms[3 * face + 1] = np.argsort(quarter)
+        perms[3 * face + 2] = quarter[quarter]
+    perms.flags.writeable = False
+    return perms
+
+
+MOVE_PERMS = _build_move_perms()
+
+# Stickers each move relocates (destination, source). Without Numba, moves
+# gather just these 20 positions instead of all 54.
+_MOVE_DST = tuple(np.flatnonzero(perm != _POSITIONS) for perm in MOVE_PERMS)
+_MOVE_SRC = tuple(perm[dst] for perm, dst in zip(MOVE_PERMS, _MOVE_DST))
+
+# Face turned by each move id: 0=U, 1=D, 2=L, 3=R, 4=F, 5=B (opposite faces
+# differ only in the lowest bit).
+MOVE_FACE = tuple(m // 3 for m in range(18))
+
+# Pseudo-face for "no previous move", i.e. the root of a search.
+NO_FACE = 6
+
+
+def _faces_commute(face_a: int, face_b: int) -> bool:
+    """Whether turns of the two faces commute under this move table."""
+    a = MOVE_PERMS[3 * face_a]
+    b = MOVE_PERMS[3 * face_b]
+    return bool(np.array_equal(a[b], b[a]))
+
+
+def _allowed_after(last_face: int, face: int) -> bool:
+    """Whether a turn of ``face`` may follow a turn of ``last_face`` in a search."""
+    if face == last_face:
+        return False  # merges into a single turn of that face
+    # Commuting opposite faces: keep only one order (e.g. U D, never D U).
+    # Checked against the table because this model's F and B turns overlap.
+    return not (face == last_face ^ 1 and face < last_face
+                and _faces_commute(face, last_face))
+
+
+# Move ids worth trying after a turn of each face (index NO_FACE: all moves).
+# Cuts the branching factor from 18 to 15 (or 12 after a commuting D or R).
+NEXT_MOVES = tuple(
+    tuple(m for m in range(18) if last_face == NO_FACE or _allowed_after(last_face, MOVE_FACE[m]))
+    for last_face in range(NO_FACE + 1)
+)
+
+# Solved cube, built once at import: stickers (index i holds the color id of
+# face i // 9), their raw bytes, and their Zobrist hash.
+SOLVED_STICKERS = np.repeat(np.arange(6, dtype=np.uint8), 9)
+SOLVED_STICKERS.flags.writeable = False
+SOLVED_BYTES = SOLVED_STICKERS.tobytes()
+SOLVED_HASH = int(zobrist_hash(SOLVED_STICKERS))
+
+
 class Cube:
     """
-    Represents the state of a Rubik's Cube using a 54-character string.
+    Represents the state of a Rubik's Cube.
+    
+    Stickers are stored as a length-54 ``uint8`` array of color ids
+    (index into ``COLORS``); moves permute that array in place.
     
     Attributes:
-        state (str): 54-character string representing the cube state.
+        stickers (np.ndarray): Color id of each of the 54 stickers.
+        state (str): 54-character string view of ``stickers``.
+        zhash (int): Zobrist hash of ``stickers``. Updated by every move when
+            Numba is available; otherwise recomputed on first read after moves.
     """
     
     # Face indices
     WHITE, ORANGE, GREEN, RED, BLUE, YELLOW = range(6)
     
-    def __init__(self, state: str | None = None) -> None:
+    # Last decoded state string and the sticker bytes it was decoded from.
+    _state_raw = b""
+    _state_str = ""
+    
+    # Cached Zobrist hash; None when moves have made it stale.
+    _zhash: int | None = None
+    
+    def __init__(self, state: str | bytes | bytearray | None = None) -> None:
         """
         Initialize a Cube with a given state or a solved state.
         
         Args:
-            state (str, optional): 54-character string. Defaults to solved state.
+            state (str | bytes | bytearray, optional): 54 color characters,
+                as a string or ASCII bytes. Defaults to solved state.
         
         Raises:
             ValueError: If state length is not 54 or contains invalid characters.
         """
         if state is None:
-                self.state = "WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYY"
+            self.stickers = SOLVED_STICKERS.copy()
+            self.zhash = SOLVED_HASH
         else:
             if len(state) != 54:
                 raise ValueError(f"State must be 54 characters, got {len(state)}")
             # Validate that state only contains valid colors
-            valid_colors = set("WOGRYB")
-            if not all(c in valid_colors for c in state):
+            if isinstance(state, str):
+                has_invalid = bool(state.translate(_STRIP_COLORS))
+            else:
+                has_invalid = bool(bytes(state).translate(None, _COLOR_BYTES))
+            if has_invalid:
                 raise ValueError(f"Invalid characters in state. Must be W, O, G, R, Y, B")
-            self.state = state
+            self.stickers = _encode(state)
+            self.rehash()
+        # Buffer reused by the move kernels so moves never allocate.
+        self._scratch = np.empty(54, dtype=np.uint8)
+    
+    @property
+    def state(self) -> str:
+        """The 54-character state string, decoded from the sticker array."""
+        # Cached against the raw sticker bytes (much cheaper than decoding),
+        # so any change to the stickers, however it is made, misses the cache.
+        raw = self.stickers.tobytes()
+        if raw != self._state_raw:
+            self._state_raw = raw
+            self._state_str = _decode(self.stickers)
+        return self._state_str
+    
+    @state.setter
+    def state(self, state: str) -> None:
+        self.stickers = _encode(state)
+        self.rehash()
+    
+    @property
+    def zhash(self) -> int:
+        """Zobrist hash of the stickers, recomputed here if moves left it stale."""
+        if self._zhash is None:
+            self._zhash = int(zobrist_hash(self.stickers))
+        return self._zhash
+    
+    @zhash.setter
+    def zhash(self, value: int) -> None:
+        self._zhash = value
+    
+    def rehash(self) -> None:
+        """
+        Recompute ``zhash`` from the stickers.
+        
+        Moves keep the hash consistent on their own; call this only after
+        modifying ``stickers`` directly.
+        """
+        self._zhash = int(zobrist_hash(self.stickers))
     
     def __str__(self) -> str:
         """Return the 54-character state string."""
@@ -64,11 +328,39 @@ class Cube:
         """Check equality based on state."""
         if not isinstance(other, Cube):
             return False
-        return self.state == other.state
+        # Different hashes settle almost every comparison; equal hashes are
+        # confirmed on the bytes so a collision can never merge two states.
+        return self.zhash == other.zhash and self.stickers.tobytes() == other.stickers.tobytes()
+    
+    def __hash__(self) -> int:
+        """Return the Zobrist hash of the state."""
+        return self.zhash
+    
+    @classmethod
+    def from_trusted(cls, stickers: np.ndarray, zhash: int | None = None) -> "Cube":
+        """
+        Build a cube directly from a color-id array, skipping validation.
+        
+        For solver internals whose stickers are known to be valid. The cube
+        takes ownership of ``stickers`` (pass a copy if it is shared).
+        
+        Args:
+            stickers (np.ndarray): Length-54 ``uint8`` array of color ids.
+            zhash (int, optional): Known Zobrist hash. Computed on first
+                read if omitted.
+        
+        Returns:
+            Cube: The new cube.
+        """
+        cube = cls.__new__(cls)
+        cube.stickers = stickers
+        cube._scratch = np.empty(54, dtype=np.uint8)
+        cube._zhash = zhash
+        return cube
     
     def copy(self) -> "Cube":
         """Return a deep copy of this cube."""
-        return Cube(self.state)
+        return self.from_trusted(self.stickers.copy(), self._zhash)
     
     def is_solved(self) -> bool:
         """
@@ -77,8 +369,9 @@ class Cube:
         Returns:
             bool: True if all faces are uniform color.
         """
-        target = "WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYY"
-        return self.state == target
+        # The hash rules out almost every unsolved state with one int compare;
+        # the byte compare only runs on a match, to exclude hash collisions.
+        return self.zhash == SOLVED_HASH and self.stickers.tobytes() == SOLVED_BYTES
     
     def get_face(self, face_idx: int) -> str:
         """
@@ -91,20 +384,43 @@ class Cube:
             str: 9-character face state.
         """
         start = face_idx * 9
-        return self.state[start:start + 9]
+        return _decode(self.stickers[start:start + 9])
     
-    def set_face(self, face_idx: int, face_state: str) -> None:
+    def set_face(self, face_idx: int, face_state: str | bytes) -> None:
         """
         Set the state of a face.
         
         Args:
             face_idx (int): Face index (0-5).
-            face_state (str): 9-character string for the face.
+            face_state (str | bytes): 9 color characters for the face.
+        
+        Raises:
+            ValueError: If face_state is not 9 characters or contains invalid colors.
         """
         if len(face_state) != 9:
             raise ValueError(f"Face state must be 9 characters, got {len(face_state)}")
+        if isinstance(face_state, str):
+            has_invalid = bool(face_state.translate(_STRIP_COLORS))
+        else:
+            has_invalid = bool(bytes(face_state).translate(None, _COLOR_BYTES))
+        if has_invalid:
+            raise ValueError("Invalid characters in face state. Must be W, O, G, R, Y, B")
+        if isinstance(face_state, str):
+            face_state = face_state.encode("ascii")
+        self._write_face(face_idx * 9, _ENCODE[np.frombuffer(face_state, dtype=np.uint8)])
+    
+    def _write_face(self, start: int, face: np.ndarray) -> None:
+        """Overwrite the 9 stickers at ``start``, updating ``zhash`` for just those."""
+        positions = _POSITIONS[start:start + 9]
+        old = self.stickers[start:start + 9]
+        delta = ZOBRIST[positions, old] ^ ZOBRIST[positions, face]
+        self.zhash ^= int(np.bitwise_xor.reduce(delta))
+        self.stickers[start:start + 9] = face
+    
+    def _rotate_face(self, face_idx: int, face_perm: np.ndarray) -> None:
+        """Permute the 9 stickers of a face with one gather."""
         start = face_idx * 9
-        self.state = self.state[:start] + face_state + self.state[start + 9:]
+        self._write_face(start, self.stickers[start + face_perm])
     
     def rotate_face_clockwise(self, face_idx: int) -> None:
         """
@@ -113,12 +429,8 @@ class Cube:
         Args:
             face_idx (int): Face index (0-5).
         """
-        face = self.get_face(face_idx)
         # Rotate: 0->2, 1->5, 2->8, 3->1, 4->4, 5->7, 6->0, 7->3, 8->6
-        rotated = (face[6] + face[3] + face[0] +
-                   face[7] + face[4] + face[1] +
-                   face[8] + face[5] + face[2])
-        self.set_face(face_idx, rotated)
+        self._rotate_face(face_idx, _FACE_CW)
     
     def rotate_face_counterclockwise(self, face_idx: int) -> None:
         """
@@ -127,12 +439,8 @@ class Cube:
         Args:
             face_idx (int): Face index (0-5).
         """
-        face = self.get_face(face_idx)
         # Rotate: 0->6, 1->3, 2->0, 3->7, 4->4, 5->1, 6->8, 7->5, 8->2
-        rotated = (face[2] + face[5] + face[8] +
-                   face[1] + face[4] + face[7] +
-                   face[0] + face[3] + face[6])
-        self.set_face(face_idx, rotated)
+        self._rotate_face(face_idx, _FACE_CCW)
     
     def rotate_face_180(self, face_idx: int) -> None:
         """
@@ -141,188 +449,105 @@ class Cube:
         Args:
             face_idx (int): Face index (0-5).
         """
-        self.rotate_face_clockwise(face_idx)
-        self.rotate_face_clockwise(face_idx)
+        self._rotate_face(face_idx, _FACE_180)
     
-    def move_U(self) -> None:
-        """Apply Up move (clockwise when looking from top)."""
-        # Rotate white face
-        self.rotate_face_clockwise(self.WHITE)
-        
-        # Rotate edge pieces: Front -> Left -> Back -> Right -> Front
-        top_row_indices = (0, 1, 2)
+    def apply_move(self, move_id: int) -> None:
+        """
+        Apply a move by id.
         
-        front = [self.state[18 + i] for i in top_row_indices]
-        left = [self.state[9 + i] for i in top_row_indices]
-        back = [self.state[36 + i] for i in top_row_indices]
-        right = [self.state[27 + i] for i in top_row_indices]
+        Args:
+            move_id (int): Index into ``MOVE_NAMES`` (0-17).
+        """
+        if HAS_NUMBA:
+            self._zhash = permute_inplace_hashed(
+                self.stickers, MOVE_PERMS[move_id], self._scratch, ZOBRIST, np.uint64(self.zhash)
+            )
+        else:
+            # In NumPy an incremental hash update costs more than the move
+            # itself, so only the moved stickers are gathered and the hash
+            # is left for the next read of ``zhash``.
+            stickers = self.stickers
+            stickers[_MOVE_DST[move_id]] = stickers[_MOVE_SRC[move_id]]
+            self._zhash = None
+    
+    def apply_sequence(self, move_ids: np.ndarray) -> None:
+        """
+        Apply a sequence of moves by id in a single kernel call.
         
-        # Rotate: Front <- Right, Left <- Front, Back <- Left, Right <- Back
-        new_state = list(self.state)
-        for i, idx in enumerate(top_row_indices):
-            new_state[18 + idx] = right[i]  # Front gets Right
-            new_state[9 + idx] = front[i]   # Left gets Front
-            new_state[36 + idx] = left[i]   # Back gets Left
-            new_state[27 + idx] = back[i]   # Right gets Back
-        self.state = ''.join(new_state)
+        Args:
+            move_ids (np.ndarray): Integer array of move ids (0-17).
+        """
+        _apply_sequence(self.stickers, self.stickers, MOVE_PERMS, move_ids)
+        self.rehash()
+    
+    def move_U(self) -> None:
+        """Apply Up move (clockwise when looking from top)."""
+        self.apply_move(MOVE_U)
     
     def move_U_prime(self) -> None:
         """Apply U' move (counterclockwise when looking from top)."""
-        self.move_U()
-        self.move_U()
-        self.move_U()
+        self.apply_move(MOVE_U_PRIME)
     
     def move_U2(self) -> None:
         """Apply U2 move (180 degrees)."""
-        self.move_U()
-        self.move_U()
+        self.apply_move(MOVE_U2)
     
     def move_D(self) -> None:
         """Apply Down move (clockwise when looking from bottom)."""
-        self.rotate_face_clockwise(self.YELLOW)
-        
-        bottom_row_indices = (6, 7, 8)
-        
-        front = [self.state[18 + i] for i in bottom_row_indices]
-        left = [self.state[9 + i] for i in bottom_row_indices]
-        back = [self.state[36 + i] for i in bottom_row_indices]
-        right = [self.state[27 + i] for i in bottom_row_indices]
-        
-        new_state = list(self.state)
-        for i, idx in enumerate(bottom_row_indices):
-            new_state[18 + idx] = left[i]   # Front gets Left
-            new_state[9 + idx] = back[i]    # Left gets Back
-            new_state[36 + idx] = right[i]  # Back gets Right
-            new_state[27 + idx] = front[i]  # Right gets Front
-        self.state = ''.join(new_state)
+        self.apply_move(MOVE_D)
     
     def move_D_prime(self) -> None:
         """Apply D' move."""
-        self.move_D()
-        self.move_D()
-        self.move_D()
+        self.apply_move(MOVE_D_PRIME)
     
     def move_D2(self) -> None:
         """Apply D2 move."""
-        self.move_D()
-        self.move_D()
+        self.apply_move(MOVE_D2)
     
     def move_R(self) -> None:
         """Apply Right move (clockwise when looking from right)."""
-        self.rotate_face_clockwise(self.RED)
-        
-        right_col_indices = (2, 5, 8)
-        
-        front = [self.state[18 + i] for i in right_col_indices]
-        up = [self.state[0 + i] for i in right_col_indices]
-        back = [self.state[36 + i] for i in right_col_indices]
-        down = [self.state[45 + i] for i in right_col_indices]
-        
-        new_state = list(self.state)
-        for i, idx in enumerate(right_col_indices):
-            new_state[18 + idx] = down[i]   # Front gets Down
-            new_state[0 + idx] = front[i]   # Up gets Front
-            new_state[36 + idx] = up[i]     # Back gets Up
-            new_state[45 + idx] = back[i]   # Down gets Back
-        self.state = ''.join(new_state)
+        self.apply_move(MOVE_R)
     
     def move_R_prime(self) -> None:
         """Apply R' move."""
-        self.move_R()
-        self.move_R()
-        self.move_R()
+        self.apply_move(MOVE_R_PRIME)
     
     def move_R2(self) -> None:
         """Apply R2 move."""
-        self.move_R()
-        self.move_R()
+        self.apply_move(MOVE_R2)
     
     def move_L(self) -> None:
         """Apply Left move (clockwise when looking from left)."""
-        self.rotate_face_clockwise(self.ORANGE)
-        
-        left_col_indices = (0, 3, 6)
-        
-        front = [self.state[18 + i] for i in left_col_indices]
-        up = [self.state[0 + i] for i in left_col_indices]
-        back = [self.state[36 + i] for i in left_col_indices]
-        down = [self.state[45 + i] for i in left_col_indices]
-        
-        new_state = list(self.state)
-        for i, idx in enumerate(left_col_indices):
-            new_state[18 + idx] = up[i]     # Front gets Up
-            new_state[0 + idx] = back[i]    # Up gets Back
-            new_state[36 + idx] = down[i]   # Back gets Down
-            new_state[45 + idx] = front[i]  # Down gets Front
-        self.state = ''.join(new_state)
+        self.apply_move(MOVE_L)
     
     def move_L_prime(self) -> None:
         """Apply L' move."""
-        self.move_L()
-        self.move_L()
-        self.move_L()
+        self.apply_move(MOVE_L_PRIME)
     
     def move_L2(self) -> None:
         """Apply L2 move."""
-        self.move_L()
-        self.move_L()
+        self.apply_move(MOVE_L2)
     
     def move_F(self) -> None:
         """Apply Front move (clockwise when looking from front)."""
-        self.rotate_face_clockwise(self.GREEN)
-        
-        front_indices = (6, 7, 8)
-        
-        up = [self.state[0 + i] for i in front_indices]
-        right = [self.state[27 + i] for i in front_indices]
-        down = [self.state[45 + i] for i in [2, 1, 0]]  # Reversed
-        left = [self.state[9 + i] for i in [8, 5, 2]]  # Reversed
-        
-        new_state = list(self.state)
-        for i, idx in enumerate(front_indices):
-            new_state[0 + idx] = left[i]
-            new_state[27 + idx] = up[i]
-            new_state[45 + [2, 1, 0][i]] = right[i]
-            new_state[9 + [8, 5, 2][i]] = down[i]
-        self.state = ''.join(new_state)
+        self.apply_move(MOVE_F)
     
     def move_F_prime(self) -> None:
         """Apply F' move."""
-        self.move_F()
-        self.move_F()
-        self.move_F()
+        self.apply_move(MOVE_F_PRIME)
     
     def move_F2(self) -> None:
         """Apply F2 move."""
-        self.move_F()
-        self.move_F()
+        self.apply_move(MOVE_F2)
     
     def move_B(self) -> None:
         """Apply Back move (clockwise when looking from back)."""
-        self.rotate_face_clockwise(self.BLUE)
-        
-        back_indices = (0, 1, 2)
-        
-        up = [self.state[0 + i] for i in [0, 3, 6]]  # Left column of up
-        left = [self.state[9 + i] for i in back_indices]
-        down = [self.state[45 + i] for i in [8, 5, 2]]  # Right column of down, reversed
-        right = [self.state[27 + i] for i in [6, 3, 0]]  # Left column of right, reversed
-        
-        new_state = list(self.state)
-        for i, idx in enumerate(back_indices):
-            new_state[0 + [0, 3, 6][i]] = right[i]
-            new_state[9 + idx] = up[i]
-            new_state[45 + [8, 5, 2][i]] = left[i]
-            new_state[27 + [6, 3, 0][i]] = down[i]
-        self.state = ''.join(new_state)
+        self.apply_move(MOVE_B)
     
     def move_B_prime(self) -> None:
         """Apply B' move."""
-        self.move_B()
-        self.move_B()
-        self.move_B()
+        self.apply_move(MOVE_B_PRIME)
     
     def move_B2(self) -> None:
         """Apply B2 move."""
-        self.move_B()
-        self.move_B()
+        self.apply_move(MOVE_B2)
@@ -5,12 +5,41 @@ Supports all standard Rubik's Cube moves: U, D, L, R, F, B (and their variants).
 """
 
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from .cube import MOVE_INVERSE, MOVE_NAMES
 
 if TYPE_CHECKING:
     from .cube import Cube
 
 
+# Move name -> move id (index into MOVE_NAMES).
+MOVE_ID: dict[str, int] = {name: move_id for move_id, name in enumerate(MOVE_NAMES)}
+
+
+def parse_moves(moves: str | Sequence[str]) -> np.ndarray:
+    """
+    Parse move names into move ids.
+    
+    Args:
+        moves (str | Sequence[str]): Space-separated move string
+            (e.g., "U R U' R'") or a sequence of move names.
+    
+    Returns:
+        np.ndarray: int8 array of move ids.
+    
+    Raises:
+        ValueError: If any move name is not recognized.
+    """
+    names = moves.split() if isinstance(moves, str) else moves
+    try:
+        return np.fromiter(map(MOVE_ID.__getitem__, names), dtype=np.int8, count=len(names))
+    except KeyError as e:
+        raise ValueError(f"Unknown move: {e.args[0]}. Valid moves: {list(MOVE_ID)}") from None
+
+
 class Move:
     """
     Represents a single move with undo capability.
@@ -52,15 +81,26 @@ class Move:
         self.undo_func(cube)
 
 
+def _make_move(move_id: int) -> Move:
+    """Build the Move object for a move id."""
+    inverse_id = MOVE_INVERSE[move_id]
+    return Move(
+        MOVE_NAMES[move_id],
+        lambda c: c.apply_move(move_id),
+        lambda c: c.apply_move(inverse_id)
+    )
+
+
 class MoveCommand:
     """
     Command pattern interface for applying moves with history tracking.
     
-    This allows easy undo/redo functionality.
+    This allows easy undo/redo functionality. Moves are dispatched and
+    recorded by integer id; names are only resolved at the API boundary.
     """
     
     # Define all standard moves
-    MOVES: dict[str, Move] = {}
+    MOVES: dict[str, Move] = {name: _make_move(move_id) for name, move_id in MOVE_ID.items()}
     
     def __init__(self, cube: Cube) -> None:
         """
@@ -70,35 +110,7 @@ class MoveCommand:
             cube (Cube): The cube to operate on.
         """
         self.cube = cube
-        self.history: list[Move] = []
-        
-        # Initialize MOVES only once
-        if not MoveCommand.MOVES:
-            MoveCommand.MOVES = {
-                'U': Move('U', lambda c: c.move_U(), lambda c: c.move_U_prime()),
-                'U\'': Move('U\'', lambda c: c.move_U_prime(), lambda c: c.move_U()),
-                'U2': Move('U2', lambda c: c.move_U2(), lambda c: c.move_U2()),
-                
-                'D': Move('D', lambda c: c.move_D(), lambda c: c.move_D_prime()),
-                'D\'': Move('D\'', lambda c: c.move_D_prime(), lambda c: c.move_D()),
-                'D2': Move('D2', lambda c: c.move_D2(), lambda c: c.move_D2()),
-                
-                'L': Move('L', lambda c: c.move_L(), lambda c: c.move_L_prime()),
-                'L\'': Move('L\'', lambda c: c.move_L_prime(), lambda c: c.move_L()),
-                'L2': Move('L2', lambda c: c.move_L2(), lambda c: c.move_L2()),
-                
-                'R': Move('R', lambda c: c.move_R(), lambda c: c.move_R_prime()),
-                'R\'': Move('R\'', lambda c: c.move_R_prime(), lambda c: c.move_R()),
-                'R2': Move('R2', lambda c: c.move_R2(), lambda c: c.move_R2()),
-                
-                'F': Move('F', lambda c: c.move_F(), lambda c: c.move_F_prime()),
-                'F\'': Move('F\'', lambda c: c.move_F_prime(), lambda c: c.move_F()),
-                'F2': Move('F2', lambda c: c.move_F2(), lambda c: c.move_F2()),
-                
-                'B': Move('B', lambda c: c.move_B(), lambda c: c.move_B_prime()),
-                'B\'': Move('B\'', lambda c: c.move_B_prime(), lambda c: c.move_B()),
-                'B2': Move('B2', lambda c: c.move_B2(), lambda c: c.move_B2()),
-            }
+        self.history: list[int] = []
     
     def execute(self, move_name: str) -> None:
         """
@@ -110,35 +122,48 @@ class MoveCommand:
         Raises:
             ValueError: If move_name is not recognized.
         """
-        if move_name not in self.MOVES:
-            raise ValueError(f"Unknown move: {move_name}. Valid moves: {list(self.MOVES.keys())}")
+        move_id = MOVE_ID.get(move_name)
+        if move_id is None:
+            raise ValueError(f"Unknown move: {move_name}. Valid moves: {list(MOVE_ID)}")
         
-        move = self.MOVES[move_name]
-        move.apply(self.cube)
-        self.history.append(move)
+        self.cube.apply_move(move_id)
+        self.history.append(move_id)
     
     def execute_sequence(self, moves_str: str) -> None:
         """
         Execute a sequence of moves from a space-separated string.
         
+        The whole string is parsed before any move is applied, so an unknown
+        move leaves the cube unchanged.
+        
         Args:
             moves_str (str): Space-separated move names (e.g., "U R U' R' U2 F").
+        
+        Raises:
+            ValueError: If any move name is not recognized.
         """
-        moves = moves_str.split()
-        for move_name in moves:
-            self.execute(move_name)
+        move_ids = parse_moves(moves_str)
+        self.cube.apply_sequence(move_ids)
+        self.history.extend(move_ids.tolist())
     
     def undo_last(self) -> None:
         """Undo the last move."""
         if not self.history:
             raise RuntimeError("No moves to undo")
-        move = self.history.pop()
-        move.undo(self.cube)
+        move_id = self.history.pop()
+        self.cube.apply_move(MOVE_INVERSE[move_id])
     
     def undo_all(self) -> None:
-        """Undo all moves in reverse order."""
-        while self.history:
-            self.undo_last()
+        """Undo all moves in reverse order with a single sequence application."""
+        if not self.history:
+            return
+        inverse_ids = np.fromiter(
+            (MOVE_INVERSE[move_id] for move_id in reversed(self.history)),
+            dtype=np.int8,
+            count=len(self.history)
+        )
+        self.cube.apply_sequence(inverse_ids)
+        self.history.clear()
     
     def get_history(self) -> list[str]:
         """
@@ -147,7 +172,7 @@ class MoveCommand:
         Returns:
             list[str]: Names of applied moves in order.
         """
-        return [move.name for move in self.history]
+        return [MOVE_NAMES[move_id] for move_id in self.history]
     
     def get_solution_string(self) -> str:
         """
@@ -5,6 +5,7 @@ Reads 6 images (one per face) and detects cube colors, outputting a 54-character
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -22,6 +23,57 @@ try:
 except ImportError:
     HAS_OPENCV = False  # type: ignore
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False  # type: ignore
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, nogil=True)
+    def _classify_stickers(image, lut, sticker_size, n_ids):  # type: ignore
+        """
+        Return the winning BGR-table id of each sticker of a 3x3 face.
+
+        Fuses the table lookup and the per-sticker vote into one pass over
+        the pixels. Runs without the GIL so faces scan in parallel.
+        """
+        out = np.zeros(9, dtype=np.uint8)
+        counts = np.zeros(n_ids, dtype=np.int64)
+        for sticker in range(9):
+            row0 = (sticker // 3) * sticker_size
+            col0 = (sticker % 3) * sticker_size
+            counts[:] = 0
+            for y in range(row0, row0 + sticker_size):
+                for x in range(col0, col0 + sticker_size):
+                    counts[lut[image[y, x, 0] >> 3, image[y, x, 1] >> 3, image[y, x, 2] >> 3]] += 1
+            best = 0
+            best_count = 0
+            for color_id in range(1, n_ids):
+                if counts[color_id] > best_count:
+                    best = color_id
+                    best_count = counts[color_id]
+            out[sticker] = best
+        return out
+
+else:
+
+    def _classify_stickers(image, lut, sticker_size, n_ids):  # type: ignore
+        """Return the winning BGR-table id of each sticker of a 3x3 face."""
+        ids = lut[image[..., 0] >> 3, image[..., 1] >> 3, image[..., 2] >> 3]
+
+        # (3s, 3s) -> (9, s*s): row-major sticker order, then offset each
+        # sticker's ids so one bincount gives a (9, n_ids) histogram
+        stickers = ids.reshape(3, sticker_size, 3, sticker_size).transpose(0, 2, 1, 3)
+        stickers = stickers.reshape(9, -1) + (np.arange(9, dtype=np.intp) * n_ids)[:, np.newaxis]
+        counts = np.bincount(stickers.ravel(), minlength=9 * n_ids).reshape(9, n_ids)
+
+        best = counts[:, 1:].argmax(axis=1) + 1
+        best[counts[np.arange(9), best] == 0] = 0
+        return best
+
 
 class CubeScanner:
     """
@@ -39,12 +91,73 @@ class CubeScanner:
         'B': ((100, 100, 200), (130, 255, 255)),   # Blue
     }
     
+    # Color code for each lookup-table id; id 0 means no range matched.
+    COLOR_CODES = '?' + ''.join(COLOR_RANGES)
+    
+    # Lookup tables shared by all scanners; built on first use.
+    _hsv_lut: Optional["np.ndarray"] = None  # type: ignore
+    _bgr_lut: Optional["np.ndarray"] = None  # type: ignore
+    
     def __init__(self) -> None:
         """Initialize the scanner."""
         if not HAS_OPENCV:
             raise RuntimeError(
                 "OpenCV not available. Install with: pip install opencv-python"
             )
+        # Each face is scanned by its own worker thread (scan_all_faces), and
+        # the per-face images are small: keep OpenCV's SIMD paths on but its
+        # internal thread pool off to avoid oversubscription.
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(1)
+        
+        cls = type(self)
+        if cls._hsv_lut is None:
+            cls._hsv_lut = cls._build_hsv_lut()
+            cls._bgr_lut = cls._build_bgr_lut(cls._hsv_lut)
+        self.hsv_lut = cls._hsv_lut
+        self.bgr_lut = cls._bgr_lut
+    
+    @classmethod
+    def _build_hsv_lut(cls) -> "np.ndarray":  # type: ignore
+        """
+        Build an HSV -> color id lookup table from COLOR_RANGES.
+        
+        The table is indexed as ``lut[h, s >> 3, v >> 3]`` (saturation and
+        value quantized to 32 levels). Where ranges overlap, the color listed
+        first in COLOR_RANGES wins.
+        
+        Returns:
+            np.ndarray: uint8 table of shape (180, 32, 32).
+        """
+        lut = np.zeros((180, 32, 32), dtype=np.uint8)
+        ranges = list(enumerate(cls.COLOR_RANGES.values(), start=1))
+        for color_id, (lower, upper) in reversed(ranges):
+            (h_lo, s_lo, v_lo), (h_hi, s_hi, v_hi) = lower, upper
+            lut[h_lo:h_hi + 1, s_lo >> 3:(s_hi >> 3) + 1, v_lo >> 3:(v_hi >> 3) + 1] = color_id
+        return lut
+    
+    @staticmethod
+    def _build_bgr_lut(hsv_lut: "np.ndarray") -> "np.ndarray":  # type: ignore
+        """
+        Build a BGR -> color id lookup table from the HSV table.
+        
+        Each BGR cell (channels quantized to 32 levels) takes the color id of
+        its center, converted to HSV once here. Scanning then needs no
+        per-image color conversion.
+        
+        Args:
+            hsv_lut (np.ndarray): Table from ``_build_hsv_lut``.
+        
+        Returns:
+            np.ndarray: uint8 table of shape (32, 32, 32), indexed as
+            ``lut[b >> 3, g >> 3, r >> 3]``.
+        """
+        centers = np.arange(32, dtype=np.uint8) * 8 + 4
+        b, g, r = np.meshgrid(centers, centers, centers, indexing='ij')
+        bgr = np.stack([b, g, r], axis=-1).reshape(32 * 32, 32, 3)
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+        ids = hsv_lut[hsv[..., 0], hsv[..., 1] >> 3, hsv[..., 2] >> 3]
+        return ids.reshape(32, 32, 32)
     
     def detect_color(self, image: "np.ndarray", region: tuple[int, int, int, int]) -> str:  # type: ignore
         """
@@ -60,25 +173,42 @@ class CubeScanner:
         x, y, w, h = region
         roi = image[y:y+h, x:x+w]
         
-        # Convert BGR to HSV
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        # Classify every pixel through the same BGR table classify_face uses,
+        # then take the majority
+        ids = self.bgr_lut[roi[..., 0] >> 3, roi[..., 1] >> 3, roi[..., 2] >> 3]
+        counts = np.bincount(ids.ravel(), minlength=len(self.COLOR_CODES))
+        best = int(counts[1:].argmax()) + 1
         
-        # Try to match colors
-        best_match = None
-        best_score = 0
+        return self.COLOR_CODES[best] if counts[best] else '?'
+    
+    def classify_face(self, image: "np.ndarray") -> str:  # type: ignore
+        """
+        Detect the colors of all 9 stickers of a face image at once.
         
-        for color, (lower, upper) in self.COLOR_RANGES.items():
-            lower = np.array(lower, dtype=np.uint8)
-            upper = np.array(upper, dtype=np.uint8)
-            
-            mask = cv2.inRange(hsv, lower, upper)
-            score = cv2.countNonZero(mask)
-            
-            if score > best_score:
-                best_score = score
-                best_match = color
+        A sample of each sticker's interior is classified pixel by pixel
+        through the BGR lookup table and tallied per sticker.
         
-        return best_match if best_match else '?'
+        Args:
+            image (np.ndarray): Face image in BGR format.
+        
+        Returns:
+            str: 9-character string of color codes ('?' where unknown).
+        """
+        h, w = image.shape[:2]
+        sticker_size = min(h, w) // 3
+        face = image[:3 * sticker_size, :3 * sticker_size]
+        
+        grid = face.reshape(3, sticker_size, 3, sticker_size, 3)
+        # Every other pixel of the central half of a sticker: the sticker
+        # interior is uniform, while its edges pick up borders.
+        margin = sticker_size // 4
+        inner = slice(margin, margin + max(sticker_size // 2, 1), 2)
+        samples = grid[:, inner, :, inner]
+        sample_size = samples.shape[1]
+        samples = samples.reshape(3 * sample_size, 3 * sample_size, 3)
+        
+        best = _classify_stickers(samples, self.bgr_lut, sample_size, len(self.COLOR_CODES))
+        return ''.join(self.COLOR_CODES[color_id] for color_id in best.tolist())
     
     def scan_face(self, image_path: str) -> Optional[str]:
         """
@@ -93,23 +223,14 @@ class CubeScanner:
             Optional[str]: 9-character string of colors, or None if scan failed.
         """
         try:
-            image = cv2.imread(image_path)
+            # Only per-sticker color votes matter, so let the decoder
+            # downsample by 2 (JPEG skips most of the IDCT work).
+            image = cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_2)
             if image is None:
                 print(f"Error: Could not read image {image_path}")
                 return None
             
-            h, w = image.shape[:2]
-            sticker_size = min(h, w) // 3
-            
-            colors = []
-            for row in range(3):
-                for col in range(3):
-                    x = col * sticker_size
-                    y = row * sticker_size
-                    color = self.detect_color(image, (x, y, sticker_size, sticker_size))
-                    colors.append(color)
-            
-            return ''.join(colors)
+            return self.classify_face(image)
         
         except Exception as e:
             print(f"Error scanning {image_path}: {e}")
@@ -134,7 +255,7 @@ class CubeScanner:
             return None
         
         face_names = ['W', 'O', 'G', 'R', 'B', 'Y']
-        state_parts = []
+        image_files = []
         
         for face in face_names:
             # Try different image extensions
@@ -149,16 +270,20 @@ class CubeScanner:
                 print(f"Error: Could not find image for face {face}")
                 return None
             
-            print(f"Scanning face {face}...", end=' ', flush=True)
-            face_colors = self.scan_face(image_file)
-            
+            image_files.append(image_file)
+        
+        # Decoding and classification run in OpenCV/NumPy code that releases
+        # the GIL, so the six faces scan in parallel.
+        print("Scanning faces...")
+        with ThreadPoolExecutor(max_workers=len(image_files)) as executor:
+            state_parts = list(executor.map(self.scan_face, image_files))
+        
+        for face, face_colors in zip(face_names, state_parts):
             if face_colors is None:
                 return None
-            
-            state_parts.append(face_colors)
-            print(f"{face_colors}")
+            print(f"  {face}: {face_colors}")
         
-        return ''.join(state_parts)
+        return ''.join(state_parts)  # type: ignore
 
 
 def save_scan_result(state: str, faces: list[str], output_file: str) -> None:
@@ -3,8 +3,22 @@ Solvers module for Rubik's Cube solver.
 """
 
 from .solver_interface import Solver
-from .bfs_solver import BFSSolver
-from .ida_solver import IDASolver
-from .kociemba_wrapper import KociembaWrapper
+
+# Solvers are imported on first access so that importing one solver module
+# does not load the others.
+_LAZY_SOLVERS = {
+    'BFSSolver': '.bfs_solver',
+    'IDASolver': '.ida_solver',
+    'KociembaWrapper': '.kociemba_wrapper',
+}
+
+
+def __getattr__(name: str):
+    """Import solver classes lazily."""
+    if name in _LAZY_SOLVERS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_SOLVERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['Solver', 'BFSSolver', 'IDASolver', 'KociembaWrapper']
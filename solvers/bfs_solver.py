@@ -3,24 +3,40 @@ Breadth-first search (BFS) solver for Rubik's Cube.
 Educational implementation - guarantees shortest path but slow.
 """
 
-from collections import deque
-from typing import Tuple, Set
-from cube.cube import Cube
-from cube.moves import MoveCommand
+from typing import Tuple
+
+import numpy as np
+
+from cube.cube import Cube, MOVE_NAMES, MOVE_PERMS, SOLVED_HASH, SOLVED_STICKERS, zobrist_hash
 from .solver_interface import Solver
 
 
+# Parents expanded per vectorized step; bounds the (N, 18, 54) working set.
+_CHUNK = 2048
+
+
+def _in_sorted(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Return a mask of which ``values`` occur in ``sorted_values``."""
+    if sorted_values.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+    pos = np.searchsorted(sorted_values, values)
+    pos[pos == sorted_values.size] = 0
+    return sorted_values[pos] == values
+
+
 class BFSSolver(Solver):
     """
     BFS Solver for Rubik's Cube.
     
     Finds the shortest solution by exploring all move sequences level-by-level.
+    Each level is expanded as a batch: the frontier is an (N, 54) sticker
+    matrix and all 18 children of every state come from one gather through
+    the move table. States are deduplicated by Zobrist hash against the
+    last two levels only.
     Warning: Can be extremely slow for non-trivial scrambles (> 5-10 moves away).
     """
     
-    MOVES = ['U', 'U\'', 'U2', 'D', 'D\'', 'D2', 
-             'L', 'L\'', 'L2', 'R', 'R\'', 'R2',
-             'F', 'F\'', 'F2', 'B', 'B\'', 'B2']
+    MOVES = list(MOVE_NAMES)
     
     def solve(self, cube: Cube) -> Tuple[list[str], int]:
         """
@@ -38,33 +54,83 @@ class BFSSolver(Solver):
         if cube.is_solved():
             return [], 1
         
-        queue: deque[tuple[Cube, list[str]]] = deque([(cube.copy(), [])])
-        visited: Set[str] = {cube.state}
+        frontier = cube.stickers[np.newaxis, :].copy()
+        # Sorted hashes of the previous and current levels. A move changes the
+        # distance from the start by at most one, so a child of level d can
+        # only repeat a state from level d - 1 or d; older levels are dropped.
+        previous = np.empty(0, dtype=np.uint64)
+        current = np.array([cube.zhash], dtype=np.uint64)
+        # Per level: (index of parent in previous frontier, move id) of each state.
+        levels: list[tuple[np.ndarray, np.ndarray]] = []
         nodes_explored = 0
         
         # Limit search depth to prevent infinite loops
         max_depth = 8
         
-        while queue:
-            current_cube, moves = queue.popleft()
-            nodes_explored += 1
-            
-            if len(moves) >= max_depth:
-                raise RuntimeError(
-                    f"Solution not found within {max_depth} moves. "
-                    "BFS is too slow for this scramble."
-                )
+        for _ in range(max_depth):
+            if len(frontier) == 0:
+                break
             
-            for move_name in self.MOVES:
-                next_cube = current_cube.copy()
-                cmd = MoveCommand(next_cube)
-                cmd.execute(move_name)
+            candidates: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+            for start in range(0, len(frontier), _CHUNK):
+                # (n, 18, 54) -> (n * 18, 54); child i is move i % 18 of parent i // 18
+                children = frontier[start:start + _CHUNK][:, MOVE_PERMS].reshape(-1, 54)
+                hashes = zobrist_hash(children)
                 
-                if next_cube.is_solved():
-                    return moves + [move_name], nodes_explored
+                for child in np.flatnonzero(hashes == SOLVED_HASH):
+                    if np.array_equal(children[child], SOLVED_STICKERS):
+                        parent = start + int(child) // 18
+                        nodes_explored += parent + 1
+                        moves = self._reconstruct(levels, parent, int(child) % 18)
+                        return moves, nodes_explored
                 
-                if next_cube.state not in visited:
-                    visited.add(next_cube.state)
-                    queue.append((next_cube, moves + [move_name]))
+                uniq, first = np.unique(hashes, return_index=True)
+                seen = _in_sorted(previous, uniq) | _in_sorted(current, uniq)
+                keep = np.sort(first[~seen])
+                candidates.append((hashes[keep], start * 18 + keep, children[keep]))
+            
+            nodes_explored += len(frontier)
+            
+            hashes = np.concatenate([c[0] for c in candidates])
+            child_ids = np.concatenate([c[1] for c in candidates])
+            # Chunks may share children; keep the first occurrence in BFS order.
+            uniq, first = np.unique(hashes, return_index=True)
+            keep = np.sort(first)
+            
+            # Parent pointers stay compact: int32 index + uint8 move per state.
+            levels.append((
+                (child_ids[keep] // 18).astype(np.int32),
+                (child_ids[keep] % 18).astype(np.uint8)
+            ))
+            frontier = np.concatenate([c[2] for c in candidates])[keep]
+            previous, current = current, uniq
+        
+        if len(frontier) == 0:
+            raise RuntimeError("No solution found (should not happen).")
+        raise RuntimeError(
+            f"Solution not found within {max_depth} moves. "
+            "BFS is too slow for this scramble."
+        )
+    
+    @staticmethod
+    def _reconstruct(
+        levels: list[tuple[np.ndarray, np.ndarray]],
+        parent: int,
+        last_move: int
+    ) -> list[str]:
+        """
+        Walk parent pointers back to the start state.
         
-        raise RuntimeError("No solution found (should not happen).")
+        Args:
+            levels: (parent index, move id) arrays for each expanded level.
+            parent (int): Frontier index of the solved state's parent.
+            last_move (int): Move id that reaches the solved state.
+        
+        Returns:
+            list[str]: Move names from the start state to solved.
+        """
+        move_ids = [last_move]
+        for parents, moves in reversed(levels):
+            move_ids.append(int(moves[parent]))
+            parent = int(parents[parent])
+        return [MOVE_NAMES[move_id] for move_id in reversed(move_ids)]
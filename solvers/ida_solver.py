@@ -3,14 +3,30 @@ IDA* (Iterative Deepening A*) solver for Rubik's Cube.
 Uses heuristic search to find optimal solutions efficiently.
 """
 
-from typing import List, Tuple, Callable, Optional
-from cube.cube import Cube
-from cube.moves import MoveCommand
+from typing import List, Tuple, Callable
+
+import numpy as np
+
+from cube.cube import (
+    Cube, MOVE_FACE, MOVE_NAMES, MOVE_PERMS, NEXT_MOVES, NO_FACE,
+    SOLVED_BYTES, SOLVED_HASH, SOLVED_STICKERS, ZOBRIST
+)
+from cube._fastmoves import apply_move_hashed
+from .tt import TranspositionTable
+
+
+# Per-move permutation rows, pre-sliced so the search loop skips the indexing.
+_PERMS = tuple(MOVE_PERMS)
+
+# One quarter turn moves 20 stickers, so it changes at most 20 mismatches.
+_STICKERS_PER_MOVE = 20
 
 
 class IDASolver:
     """Iterative Deepening A* solver for Rubik's Cube."""
     
+    MOVES = list(MOVE_NAMES)
+    
     def __init__(self, heuristic: str = "misplaced") -> None:
         """Initialize IDA* solver with specified heuristic.
         
@@ -24,81 +40,37 @@ class IDASolver:
         self.name = "IDASolver"
         self.nodes_explored = 0
         
-        # Set heuristic function
-        if heuristic == "misplaced":
-            self.heuristic: Callable[[Cube], int] = self._heuristic_misplaced
-        elif heuristic == "wrong_face":
-            self.heuristic: Callable[[Cube], int] = self._heuristic_wrong_face
+        # Set heuristic function. Color ids equal face ids, so a sticker is
+        # on the wrong face exactly when it is misplaced: both names share
+        # one implementation.
+        if heuristic in ("misplaced", "wrong_face"):
+            self.heuristic: Callable[[np.ndarray], int] = self._heuristic_misplaced
         else:
-            self.heuristic: Callable[[Cube], int] = self._heuristic_manhattan
+            self.heuristic: Callable[[np.ndarray], int] = self._heuristic_manhattan
     
-    def _heuristic_misplaced(self, cube: Cube) -> int:
+    def _heuristic_misplaced(self, stickers: np.ndarray) -> int:
         """Count misplaced pieces heuristic.
         
         Args:
-            cube: Current cube state
-            
-        Returns:
-            Number of misplaced pieces divided by 8 (as lower bound)
-        """
-        target = "WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYYY"
-        
-        # Ensure both strings are exactly 54 characters
-        if len(cube.state) != 54 or len(target) != 54:
-            return 0
-        
-        misplaced = sum(1 for i in range(54) if cube.state[i] != target[i])
-        return misplaced // 8  # Divide by 8 for admissible heuristic
-    
-    def _heuristic_wrong_face(self, cube: Cube) -> int:
-        """Count wrong-face pieces heuristic.
-        
-        Args:
-            cube: Current cube state
+            stickers: Sticker color ids of the current state
             
         Returns:
-            Number of pieces on wrong face divided by 12
+            Number of misplaced stickers divided by 20 (as lower bound)
         """
-        target = "WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYYY"
-        
-        # Define which indices belong to which face
-        faces = {
-            'W': list(range(0, 9)),      # White (top)
-            'O': list(range(9, 18)),     # Orange (left)
-            'G': list(range(18, 27)),    # Green (front)
-            'R': list(range(27, 36)),    # Red (right)
-            'B': list(range(36, 45)),    # Blue (back)
-            'Y': list(range(45, 54))     # Yellow (bottom)
-        }
-        
-        # Ensure length is correct
-        if len(cube.state) != 54 or len(target) != 54:
-            return 0
-        
-        wrong_face = 0
-        for face_color, indices in faces.items():
-            for idx in indices:
-                if cube.state[idx] != face_color:
-                    wrong_face += 1
-        
-        return wrong_face // 12  # Divide by 12 for admissible heuristic
+        misplaced = int(np.count_nonzero(stickers != SOLVED_STICKERS))
+        return -(-misplaced // _STICKERS_PER_MOVE)  # Round up; still admissible
     
-    def _heuristic_manhattan(self, cube: Cube) -> int:
+    def _heuristic_manhattan(self, stickers: np.ndarray) -> int:
         """Simple manhattan distance heuristic.
         
         Args:
-            cube: Current cube state
+            stickers: Sticker color ids of the current state
             
         Returns:
             Estimated moves needed (simple estimate)
         """
-        target = "WWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYYY"
-        
-        if len(cube.state) != 54 or len(target) != 54:
-            return 0
-        
-        misplaced = sum(1 for i in range(54) if cube.state[i] != target[i])
-        return max(0, misplaced // 8)
+        misplaced = int(np.count_nonzero(stickers != SOLVED_STICKERS))
+        return misplaced // _STICKERS_PER_MOVE
     
     def solve(self, cube: Cube) -> Tuple[List[str], int]:
         """Solve cube using IDA* algorithm.
@@ -110,21 +82,31 @@ class IDASolver:
             Tuple of (moves list, nodes explored)
         """
         self.nodes_explored = 0
+        # Moves on the current search path; pushed/popped while backtracking
+        self._path: List[str] = []
+        # Set by _search when it reaches the solved state
+        self._solution: List[str] = []
         
         # Check if already solved
         if cube.is_solved():
             return [], 0
         
+        # Persists across iterations: a state that failed with N moves left
+        # fails again whenever it is reached with N or fewer moves left.
+        self._tt = TranspositionTable()
+        
         # IDA* with depth limits
         depth_limit = 1
         max_depth = 20  # Maximum depth to search
         
+        # The search works on raw sticker arrays: row d holds the state at
+        # depth d, and each child is written straight into the next row.
+        self._states = np.empty((max_depth + 1, 54), dtype=np.uint8)
+        self._states[0] = cube.stickers
+        
         while depth_limit <= max_depth:
-            result = self._search(cube.copy(), [], 0, depth_limit)
-            
-            if result is not None:
-                moves = result
-                return moves, self.nodes_explored
+            if self._search(0, cube.zhash, depth_limit, NO_FACE):
+                return self._solution, self.nodes_explored
             
             depth_limit += 1
         
@@ -132,100 +114,60 @@ class IDASolver:
     
     def _search(
         self, 
-        cube: Cube, 
-        moves: List[str], 
         current_depth: int, 
-        depth_limit: int
-    ) -> Optional[List[str]]:
+        zhash: int, 
+        depth_limit: int,
+        last_face: int
+    ) -> bool:
         """Recursive search function.
         
         Args:
-            cube: Current cube state
-            moves: Moves applied so far
-            current_depth: Current depth in search tree
+            current_depth: Current depth in search tree; the state is
+                ``self._states[current_depth]``
+            zhash: Zobrist hash of the current state
             depth_limit: Maximum depth for this iteration
+            last_face: Face turned by the previous move (NO_FACE at the root)
             
         Returns:
-            Solution moves if found, None otherwise
+            True if a solution was found (stored in ``self._solution``)
         """
         self.nodes_explored += 1
+        state = self._states[current_depth]
         
         # Check if solved
-        if cube.is_solved():
-            return moves
+        if zhash == SOLVED_HASH and state.tobytes() == SOLVED_BYTES:
+            self._solution = list(self._path)
+            return True
         
         # Check depth limit
         if current_depth >= depth_limit:
-            return None
-        
-        # Try all possible moves
-        all_moves = [
-            "U", "U'", "U2",
-            "D", "D'", "D2",
-            "L", "L'", "L2",
-            "R", "R'", "R2",
-            "F", "F'", "F2",
-            "B", "B'", "B2"
-        ]
-        
-        for move in all_moves:
-            # Skip reverse of last move (avoid oscillation)
-            if moves and self._is_reverse(moves[-1], move):
-                continue
-            
-            # Make move using MoveCommand
-            try:
-                cube_copy = cube.copy()
-                cmd = MoveCommand(cube_copy)
-                cmd.execute(move)
-                
-                # Calculate heuristic
-                h_value = self.heuristic(cube_copy)
-                f_value = current_depth + 1 + h_value
-                
-                # Prune if exceeds depth limit
-                if f_value <= depth_limit:
-                    result = self._search(
-                        cube_copy,
-                        moves + [move],
-                        current_depth + 1,
-                        depth_limit
-                    )
-                    
-                    if result is not None:
-                        return result
-            except Exception:
-                # Skip invalid moves
-                continue
-        
-        return None
-    
-    @staticmethod
-    def _is_reverse(move1: str, move2: str) -> bool:
-        """Check if two moves are reverses of each other.
-        
-        Args:
-            move1: First move
-            move2: Second move
-            
-        Returns:
-            True if moves are reverses
-        """
-        # Remove modifiers and get base move
-        base1 = move1[0]
-        base2 = move2[0]
+            return False
         
-        if base1 != base2:
+        # Skip states already searched at least this deep without success
+        remaining = depth_limit - current_depth
+        if self._tt.probe(zhash, remaining):
             return False
         
-        # Check if one is inverse of the other
-        has_prime1 = "'" in move1
-        has_prime2 = "'" in move2
-        has_2_1 = "2" in move1
-        has_2_2 = "2" in move2
+        child = self._states[current_depth + 1]
+        seed = np.uint64(zhash)
         
-        # X and X' are reverses
-        if has_prime1 != has_prime2 and not has_2_1 and not has_2_2:
-            return True
+        # Try moves that don't turn the last face again (or undo a
+        # commuting opposite-face turn)
+        for move_id in NEXT_MOVES[last_face]:
+            child_hash = apply_move_hashed(state, child, _PERMS[move_id], ZOBRIST, seed)
+            
+            # Calculate heuristic
+            h_value = self.heuristic(child)
+            f_value = current_depth + 1 + h_value
+            
+            # Prune if exceeds depth limit
+            if f_value <= depth_limit:
+                self._path.append(self.MOVES[move_id])
+                found = self._search(current_depth + 1, child_hash, depth_limit, MOVE_FACE[move_id])
+                self._path.pop()
+                
+                if found:
+                    return True
         
+        self._tt.store(zhash, remaining)
         return False
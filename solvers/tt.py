@@ -0,0 +1,80 @@
+"""
+Fixed-size transposition table keyed by Zobrist hashes.
+
+Entries live in a power-of-two NumPy array indexed by ``hash & mask``, so
+lookups never hash Python objects or resize. Probe/store are compiled with
+Numba when it is installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False  # type: ignore
+
+
+ENTRY_DTYPE = np.dtype([('key', np.uint64), ('depth', np.int8)])
+
+
+def _probe(keys, depths, mask, h, depth):  # type: ignore
+    idx = h & mask
+    return keys[idx] == h and depths[idx] >= depth
+
+
+def _store(keys, depths, mask, h, depth):  # type: ignore
+    idx = h & mask
+    # Depth-preferred replacement: never overwrite a deeper search result.
+    if depth >= depths[idx]:
+        keys[idx] = h
+        depths[idx] = depth
+
+
+if HAS_NUMBA:
+    _probe = njit(cache=True)(_probe)
+    _store = njit(cache=True)(_store)
+
+
+class TranspositionTable:
+    """
+    Records states whose subtree was searched to a given remaining depth.
+
+    Each entry holds (hash, depth). On a slot collision the entry searched
+    deeper wins.
+    """
+
+    def __init__(self, size_log2: int = 22) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            size_log2 (int): Table holds 2**size_log2 entries.
+        """
+        self.table = np.zeros(1 << size_log2, dtype=ENTRY_DTYPE)
+        self._mask = np.uint64((1 << size_log2) - 1)
+        self._keys = self.table['key']
+        self._depths = self.table['depth']
+
+    def probe(self, h: int, depth: int) -> bool:
+        """
+        Check whether a state was already searched at least this deep.
+
+        Args:
+            h (int): Zobrist hash of the state.
+            depth (int): Remaining search depth.
+
+        Returns:
+            bool: True if a stored entry covers ``depth``.
+        """
+        return bool(_probe(self._keys, self._depths, self._mask, np.uint64(h), depth))
+
+    def store(self, h: int, depth: int) -> None:
+        """
+        Record that a state was searched to ``depth``.
+
+        Args:
+            h (int): Zobrist hash of the state.
+            depth (int): Remaining search depth that was covered.
+        """
+        _store(self._keys, self._depths, self._mask, np.uint64(h), depth)
@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures.
+States are built once per session and handed to tests as strings, so each
+test constructs its own independent Cube from them.
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+import pytest  # type: ignore
+
+from cube.cube import Cube
+
+
+@pytest.fixture(scope="session")
+def solved_state() -> str:
+    """State string of a solved cube."""
+    return Cube().state
+
+
+@pytest.fixture(scope="session")
+def ur_scrambled_state() -> str:
+    """State string of a solved cube after U then R."""
+    cube = Cube()
+    cube.move_U()
+    cube.move_R()
+    return cube.state
+
+
+@pytest.fixture(scope="session")
+def solve_cached() -> Callable[[Any, str], Tuple[list[str], int]]:
+    """
+    Solve a state once per (solver type, heuristic, state) per session.
+    
+    Returns:
+        Callable: ``solve(solver, state) -> (moves, nodes)``; each call gets
+        its own copy of the move list.
+    """
+    cache: dict[tuple[str, Optional[str], str], Tuple[list[str], int]] = {}
+    
+    def solve(solver: Any, state: str) -> Tuple[list[str], int]:
+        key = (type(solver).__name__, getattr(solver, 'heuristic_type', None), state)
+        if key not in cache:
+            cache[key] = solver.solve(Cube(state))
+        moves, nodes = cache[key]
+        return list(moves), nodes
+    
+    return solve
@@ -3,17 +3,53 @@ Unit tests for the Cube class.
 Tests cube state, rotations, and move applications.
 """
 
+import numpy as np
 import pytest  # type: ignore
-import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from cube.cube import Cube
+from cube.cube import (
+    Cube, MOVE_FACE, MOVE_NAMES, MOVE_PERMS, NEXT_MOVES, NO_FACE,
+    ZOBRIST, zobrist_hash
+)
+from cube._fastmoves import apply_move_hashed, apply_sequence
 from cube.moves import MoveCommand
 
 
+FACES = range(6)
+# Nine distinct-enough stickers so every quarter/half turn of a face shows.
+FACE_PATTERN = "WOGRBYWOG"
+IDENTITY = np.arange(54)
+
+
+def _move_perm(method: str) -> np.ndarray:
+    """
+    Sticker permutation produced by calling a Cube move method.
+    
+    Stickers only hold color ids 0-5, so each of the 54 position labels is
+    written in base 6 across three cubes; after the move the digits are
+    read back and recombined (new[i] = old[perm[i]]).
+    
+    Args:
+        method (str): Cube method name, e.g. ``'move_U'``.
+    
+    Returns:
+        np.ndarray: The resulting gather permutation.
+    """
+    perm = np.zeros(54, dtype=np.intp)
+    for place in (1, 6, 36):
+        cube = Cube.from_trusted(((IDENTITY // place) % 6).astype(np.uint8))
+        getattr(cube, method)()
+        perm += cube.stickers.astype(np.intp) * place
+    return perm
+
+
+def _compose(*perms: np.ndarray) -> np.ndarray:
+    """Permutation equivalent to applying ``perms`` left to right."""
+    result = IDENTITY
+    for perm in perms:
+        result = result[perm]
+    return result
+
+
 class TestCubeBasics:
     """Test basic Cube functionality."""
     
@@ -41,6 +77,15 @@ class TestCubeBasics:
         with pytest.raises(ValueError):  # type: ignore
             Cube(invalid_state)
     
+    def test_cube_initialization_with_bytes(self) -> None:
+        """Test cube accepts the state as ASCII bytes or a bytearray."""
+        state = "RWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYY"
+        
+        assert Cube(state.encode("ascii")) == Cube(state)
+        assert Cube(bytearray(state, "ascii")).state == state
+        with pytest.raises(ValueError):  # type: ignore
+            Cube(b"X" * 54)
+    
     def test_cube_copy(self) -> None:
         """Test cube copy is independent."""
         cube1 = Cube("RWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYY")
@@ -48,18 +93,44 @@ class TestCubeBasics:
         
         assert cube1.state == cube2.state
         assert cube1 is not cube2
+        
+        cube2.move_U()
+        assert cube1.state != cube2.state
+    
+    def test_from_trusted(self) -> None:
+        """Test building a cube from a color-id array."""
+        source = Cube()
+        source.move_F()
+        
+        cube = Cube.from_trusted(source.stickers.copy())
+        
+        assert cube == source
+        assert cube.zhash == source.zhash
+    
+    def test_state_tracks_sticker_changes(self) -> None:
+        """Test the cached state string follows moves and direct writes."""
+        cube = Cube()
+        solved_state = cube.state
+        
+        cube.move_R()
+        assert cube.state == Cube(cube.state).state != solved_state
+        
+        cube.stickers[:] = 0
+        assert cube.state == 'W' * 54
 
 
 class TestCubeRotations:
     """Test face rotations."""
     
-    def test_rotate_face_clockwise(self) -> None:
+    @pytest.mark.parametrize("face", FACES)
+    def test_rotate_face_clockwise(self, face: int) -> None:
         """Test clockwise face rotation."""
         cube = Cube()
-        original = cube.get_face(0)  # White face
+        cube.set_face(face, FACE_PATTERN)
+        original = cube.get_face(face)
         
-        cube.rotate_face_clockwise(0)
-        rotated = cube.get_face(0)
+        cube.rotate_face_clockwise(face)
+        rotated = cube.get_face(face)
         
         # After rotation: 0->2, 1->5, 2->8, 3->1, 4->4, 5->7, 6->0, 7->3, 8->6
         expected = (original[6] + original[3] + original[0] +
@@ -67,75 +138,157 @@ class TestCubeRotations:
                     original[8] + original[5] + original[2])
         assert rotated == expected
     
-    def test_rotate_face_counterclockwise_is_inverse(self) -> None:
+    @pytest.mark.parametrize("face", FACES)
+    def test_rotate_face_counterclockwise_is_inverse(self, face: int) -> None:
         """Test that counterclockwise is the inverse of clockwise."""
         cube = Cube()
+        cube.set_face(face, FACE_PATTERN)
         original = cube.state
         
-        cube.rotate_face_clockwise(0)
-        cube.rotate_face_counterclockwise(0)
+        cube.rotate_face_clockwise(face)
+        assert cube.state != original
+        cube.rotate_face_counterclockwise(face)
         
         assert cube.state == original
     
-    def test_rotate_face_180_twice_is_identity(self) -> None:
+    @pytest.mark.parametrize("face", FACES)
+    def test_rotate_face_180_twice_is_identity(self, face: int) -> None:
         """Test that two 180-degree rotations restore original state."""
         cube = Cube()
+        cube.set_face(face, FACE_PATTERN)
         original = cube.state
         
-        cube.rotate_face_180(0)
-        cube.rotate_face_180(0)
+        cube.rotate_face_180(face)
+        assert cube.state != original
+        cube.rotate_face_180(face)
         
         assert cube.state == original
+    
+    def test_set_face_accepts_bytes_and_keeps_hash(self) -> None:
+        """Test set_face with bytes input keeps the incremental hash exact."""
+        cube = Cube()
+        cube.move_R()
+        
+        cube.set_face(0, b"GGGGGGGGG")
+        
+        assert cube.get_face(0) == "GGGGGGGGG"
+        assert cube.zhash == int(zobrist_hash(cube.stickers))
+    
+    def test_set_face_rejects_invalid_colors(self) -> None:
+        """Test set_face raises ValueError and leaves the cube untouched."""
+        cube = Cube()
+        
+        for face_state in ("WWWWXWWWW", b"WWWWXWWWW", "WWWWéWWWW"):
+            with pytest.raises(ValueError):  # type: ignore
+                cube.set_face(0, face_state)
+        
+        assert cube.is_solved()
 
 
 class TestCubeMoves:
     """Test standard cube moves."""
     
     def test_move_U_cycle(self) -> None:
-        """Test U move cycles through 4 top rows."""
-        cube = Cube()
-        original = cube.state
-        
-        # Apply U move 4 times should restore original
-        for _ in range(4):
-            cube.move_U()
+        """Test four U moves compose to the identity."""
+        u = _move_perm('move_U')
         
-        assert cube.state == original
+        assert np.array_equal(_compose(u, u, u, u), IDENTITY)
     
     def test_move_U_prime_is_inverse(self) -> None:
         """Test U' is the inverse of U."""
-        cube = Cube()
-        original = cube.state
+        u, u_prime = _move_perm('move_U'), _move_perm('move_U_prime')
         
-        cube.move_U()
-        cube.move_U_prime()
-        
-        assert cube.state == original
+        assert np.array_equal(_compose(u, u_prime), IDENTITY)
     
     def test_move_U2_same_as_two_U(self) -> None:
         """Test U2 is equivalent to two U moves."""
-        cube1 = Cube()
-        cube2 = Cube()
+        u = _move_perm('move_U')
         
-        cube1.move_U2()
-        cube2.move_U()
-        cube2.move_U()
+        assert np.array_equal(_move_perm('move_U2'), _compose(u, u))
+    
+    @pytest.mark.parametrize("move", MOVE_NAMES)
+    def test_all_moves_exist(self, move: str, solved_state: str) -> None:
+        """Test that every standard move is implemented and changes the cube."""
+        cube = Cube(solved_state)
+        cmd = MoveCommand(cube)
         
-        assert cube1.state == cube2.state
+        cmd.execute(move)
+        
+        assert cube.state != solved_state
+        assert cmd.get_history() == [move]
+
+
+class TestMoveTables:
+    """Test the precomputed move permutation table."""
+    
+    def test_perms_are_permutations(self) -> None:
+        """Test every table row is a permutation of 0..53."""
+        assert MOVE_PERMS.shape == (18, 54)
+        for perm in MOVE_PERMS:
+            assert sorted(perm.tolist()) == list(range(54))
+    
+    def test_prime_perms_invert_quarter_turns(self) -> None:
+        """Test X' undoes X and X2 is X applied twice for every face."""
+        identity = np.arange(54)
+        for face in range(6):
+            quarter, prime, half = MOVE_PERMS[3 * face:3 * face + 3]
+            assert np.array_equal(quarter[prime], identity)
+            assert np.array_equal(half, quarter[quarter])
+    
+    def test_next_moves_only_skip_redundant_pairs(self) -> None:
+        """Test every pruned pair is same-face or a commuting reordering."""
+        assert len(NEXT_MOVES[NO_FACE]) == 18
+        for first in range(18):
+            allowed = NEXT_MOVES[MOVE_FACE[first]]
+            for second in range(18):
+                if second in allowed or MOVE_FACE[second] == MOVE_FACE[first]:
+                    continue
+                # Pruned opposite-face pair: the other order must be allowed
+                # and reach the same state.
+                assert first in NEXT_MOVES[MOVE_FACE[second]]
+                assert np.array_equal(MOVE_PERMS[first][MOVE_PERMS[second]],
+                                      MOVE_PERMS[second][MOVE_PERMS[first]])
     
-    def test_all_moves_exist(self) -> None:
-        """Test that all standard moves are implemented."""
+    def test_apply_move_matches_command(self) -> None:
+        """Test apply_move(id) matches executing the named move."""
+        scramble = "R U F' L2 D B'"
+        for move_id, name in enumerate(MOVE_NAMES):
+            cube1 = Cube()
+            cube2 = Cube()
+            MoveCommand(cube1).execute_sequence(scramble)
+            MoveCommand(cube2).execute_sequence(scramble)
+            
+            cube1.apply_move(move_id)
+            MoveCommand(cube2).execute(name)
+            
+            assert cube1 == cube2
+    
+    def test_apply_sequence_matches_moves(self) -> None:
+        """Test the sequence kernel matches applying moves one by one."""
         cube = Cube()
-        cmd = MoveCommand(cube)
+        seq = np.array([9, 0, 13, 8, 3, 16], dtype=np.int8)
+        for move_id in seq:
+            cube.apply_move(int(move_id))
         
-        moves = ['U', 'U\'', 'U2', 'D', 'D\'', 'D2',
-                 'L', 'L\'', 'L2', 'R', 'R\'', 'R2',
-                 'F', 'F\'', 'F2', 'B', 'B\'', 'B2']
+        out = np.empty(54, dtype=np.uint8)
+        apply_sequence(Cube().stickers, out, MOVE_PERMS, seq)
         
-        for move in moves:
-            original = cube.state
-            cmd.execute(move)
-            assert cube.state != original or cube.is_solved()
+        assert np.array_equal(out, cube.stickers)
+    
+    def test_apply_move_hashed_matches_cube(self) -> None:
+        """Test the out-of-place kernel returns the child's exact hash."""
+        parent = Cube()
+        parent.move_R()
+        for move_id in range(18):
+            child = parent.copy()
+            child.apply_move(move_id)
+            
+            out = np.empty(54, dtype=np.uint8)
+            h = apply_move_hashed(parent.stickers, out, MOVE_PERMS[move_id],
+                                  ZOBRIST, np.uint64(parent.zhash))
+            
+            assert np.array_equal(out, child.stickers)
+            assert int(h) == child.zhash
 
 
 class TestMoveCommand:
@@ -160,6 +313,17 @@ class TestMoveCommand:
         assert cube.state != original
         assert len(cmd.get_history()) == 4
     
+    def test_execute_sequence_rejects_unknown_move(self) -> None:
+        """Test an unknown move aborts the sequence before any move applies."""
+        cube = Cube()
+        cmd = MoveCommand(cube)
+        
+        with pytest.raises(ValueError):  # type: ignore
+            cmd.execute_sequence("U R X R'")
+        
+        assert cube.is_solved()
+        assert cmd.get_history() == []
+    
     def test_undo_last_move(self) -> None:
         """Test undoing the last move."""
         cube = Cube()
@@ -182,6 +346,22 @@ class TestMoveCommand:
         assert cube.is_solved()
         assert len(cmd.get_history()) == 0
     
+    def test_undo_all_restores_scrambled_start(self) -> None:
+        """Test undo_all returns to the state before the first command."""
+        cube = Cube()
+        MoveCommand(cube).execute_sequence("R2 D' B L")
+        start = cube.copy()
+        cmd = MoveCommand(cube)
+        
+        cmd.execute_sequence("F U2 R' D")
+        cmd.execute("L2")
+        cmd.undo_all()
+        
+        assert cube == start
+        assert cube.zhash == start.zhash
+        cmd.undo_all()
+        assert cube == start
+    
     def test_get_solution_string(self) -> None:
         """Test getting solution as a string."""
         cube = Cube()
@@ -210,6 +390,24 @@ class TestCubeEquality:
         cube2 = Cube("OWWWWWWWWOOOOOOOOOGGGGGGGGGRRRRRRRRRBBBBBBBBBYYYYYYYYY")
         
         assert cube1 != cube2
+    
+    def test_equal_cubes_hash_equal(self) -> None:
+        """Test that cubes reached by different move orders hash alike."""
+        cube1 = Cube()
+        cube2 = Cube()
+        MoveCommand(cube1).execute_sequence("U D")
+        MoveCommand(cube2).execute_sequence("D U")
+        
+        assert cube1 == cube2
+        assert hash(cube1) == hash(cube2)
+        assert len({cube1, cube2}) == 1
+    
+    def test_incremental_hash_matches_full_hash(self) -> None:
+        """Test zhash maintained by moves matches a from-scratch hash."""
+        cube = Cube()
+        MoveCommand(cube).execute_sequence("R U R' U' F2 L D' B2 R2 U")
+        
+        assert cube.zhash == int(zobrist_hash(cube.stickers))
 
 
 if __name__ == '__main__':  # type: ignore
@@ -0,0 +1,96 @@
+"""
+Scanner tests.
+Classifies synthetic face images through both the Numba and NumPy paths.
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import pytest  # type: ignore
+
+cv2 = pytest.importorskip("cv2")
+
+
+# BGR color of each sticker code; black matches no range and reads as '?'.
+STICKER_BGR = {
+    'W': (240, 240, 240),
+    'Y': (0, 230, 240),
+    'O': (0, 100, 255),
+    'R': (10, 10, 230),
+    'G': (40, 235, 40),
+    'B': (230, 60, 0),
+    '?': (0, 0, 0),
+}
+FACE = "WOGRBYR?W"
+
+
+def _face_image(face: str, sticker_size: int = 40, border: int = 4) -> np.ndarray:
+    """Draw a 3x3 face with dark borders between stickers."""
+    image = np.zeros((3 * sticker_size, 3 * sticker_size, 3), dtype=np.uint8)
+    for idx, code in enumerate(face):
+        row, col = divmod(idx, 3)
+        y, x = row * sticker_size, col * sticker_size
+        image[y + border:y + sticker_size, x + border:x + sticker_size] = STICKER_BGR[code]
+    return image
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])  # type: ignore
+def scan(request: Any) -> Iterator[Any]:
+    """Freshly imported python.scan with Numba available or blocked."""
+    use_numba = request.param
+    if use_numba and importlib.util.find_spec("numba") is None:
+        pytest.skip("numba not installed")
+    saved = {name: sys.modules.pop(name) for name in ("python.scan", "numba")
+             if name in sys.modules}
+    if not use_numba:
+        sys.modules["numba"] = None  # type: ignore
+    try:
+        module = importlib.import_module("python.scan")
+        assert module.HAS_NUMBA == use_numba
+        yield module
+    finally:
+        sys.modules.pop("python.scan", None)
+        sys.modules.pop("numba", None)
+        sys.modules.update(saved)
+
+
+class TestClassifyFace:
+    """Test sticker classification on synthetic faces."""
+    
+    def test_classify_face(self, scan: Any) -> None:
+        """Test every sticker of a drawn face is classified."""
+        scanner = scan.CubeScanner()
+        
+        assert scanner.classify_face(_face_image(FACE)) == FACE
+    
+    def test_classify_face_non_square_image(self, scan: Any) -> None:
+        """Test extra rows/columns beyond the 3x3 grid are ignored."""
+        scanner = scan.CubeScanner()
+        image = np.zeros((130, 125, 3), dtype=np.uint8)
+        image[:120, :120] = _face_image(FACE)
+        
+        assert scanner.classify_face(image) == FACE
+    
+    def test_detect_color_matches_classify_face(self, scan: Any) -> None:
+        """Test detect_color agrees with classify_face sticker by sticker."""
+        scanner = scan.CubeScanner()
+        image = _face_image(FACE)
+        
+        detected = ''.join(
+            scanner.detect_color(image, (col * 40 + 10, row * 40 + 10, 20, 20))
+            for row in range(3) for col in range(3)
+        )
+        
+        assert detected == scanner.classify_face(image) == FACE
+    
+    def test_scan_face_from_file(self, scan: Any, tmp_path: Path) -> None:
+        """Test a face image written to disk scans back to the same colors."""
+        scanner = scan.CubeScanner()
+        image_path = tmp_path / "G.png"
+        cv2.imwrite(str(image_path), _face_image(FACE))
+        
+        assert scanner.scan_face(str(image_path)) == FACE
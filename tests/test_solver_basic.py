@@ -3,17 +3,15 @@ Basic solver tests.
 Verifies that solvers correctly solve simple scrambles.
 """
 
-import pytest  # type: ignore
-import sys
-from pathlib import Path
+from typing import Any
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest  # type: ignore
 
 from cube.cube import Cube
 from cube.moves import MoveCommand
 from solvers.ida_solver import IDASolver
 from solvers.bfs_solver import BFSSolver
+from solvers.tt import TranspositionTable
 
 
 class TestSolverInterface:
@@ -55,36 +53,42 @@ class TestSolverOutput:
         assert isinstance(nodes, int)
 
 
+@pytest.mark.slow
 class TestSolverBasicCases:
     """Test solvers on simple cases."""
     
-    def test_ida_solves_solved_cube(self) -> None:
-        """Test IDA* recognizes a solved cube."""
-        solver = IDASolver()
-        cube = Cube()
+    @pytest.mark.parametrize("solver_cls", [IDASolver, BFSSolver])
+    def test_solves_solved_cube(self, solver_cls: Any, solved_state: str) -> None:
+        """Test each solver recognizes a solved cube without searching."""
+        solver = solver_cls()
+        cube = Cube(solved_state)
         
-        moves, _ = solver.solve(cube)  # type: ignore
+        moves, nodes = solver.solve(cube)  # type: ignore
         
-        assert len(moves) == 0
+        assert moves == []
+        assert nodes <= 1
     
-    def test_bfs_solves_solved_cube(self) -> None:
-        """Test BFS recognizes a solved cube."""
+    def test_bfs_finds_shortest_solution(self) -> None:
+        """Test BFS solves a three-move scramble in three moves."""
         solver = BFSSolver()
         cube = Cube()
+        MoveCommand(cube).execute_sequence("U F2 L'")
         
-        moves, _ = solver.solve(cube)  # type: ignore
+        moves, nodes = solver.solve(cube.copy())  # type: ignore
         
-        assert len(moves) == 0
+        assert len(moves) == 3
+        assert nodes > 0
+        MoveCommand(cube).execute_sequence(' '.join(moves))
+        assert cube.is_solved()
     
-    def test_ida_solves_one_move_scramble(self) -> None:
+    def test_ida_solves_one_move_scramble(self, solve_cached: Any) -> None:
         """Test IDA* solves a cube scrambled by one move."""
-        solver = IDASolver()
         cube = Cube()
         
         # Scramble with one move
         cube.move_U()
         
-        moves, _ = solver.solve(cube)  # type: ignore
+        moves, _ = solve_cached(IDASolver(), cube.state)
         
         # Should find solution with at least 1 move
         assert len(moves) >= 1
@@ -97,29 +101,21 @@ class TestSolverBasicCases:
             cmd.execute(move)
         assert test_cube.is_solved()
     
-    def test_ida_solves_two_move_scramble(self) -> None:
+    def test_ida_solves_two_move_scramble(
+        self, ur_scrambled_state: str, solve_cached: Any
+    ) -> None:
         """Test IDA* solves a two-move scramble."""
-        solver = IDASolver()
-        cube = Cube()
-        
-        # Scramble with two moves
-        cube.move_U()
-        cube.move_R()
-        
-        moves, _ = solver.solve(cube)  # type: ignore
+        moves, _ = solve_cached(IDASolver(), ur_scrambled_state)
         
         # Verify solution
-        test_cube = Cube()
-        test_cube.move_U()
-        test_cube.move_R()
+        test_cube = Cube(ur_scrambled_state)
         cmd = MoveCommand(test_cube)
         for move in moves:
             cmd.execute(move)
         assert test_cube.is_solved()
     
-    def test_ida_solves_known_pattern(self) -> None:
+    def test_ida_solves_known_pattern(self, solve_cached: Any) -> None:
         """Test IDA* solves a known simple pattern."""
-        solver = IDASolver()
         cube = Cube()
         
         # Apply a known pattern: R U R' U'
@@ -129,7 +125,7 @@ class TestSolverBasicCases:
             cmd.execute(move)
         
         # Should solve it
-        moves, _ = solver.solve(cube)  # type: ignore
+        moves, _ = solve_cached(IDASolver(), cube.state)
         
         # Apply solution and verify
         cmd2 = MoveCommand(cube)
@@ -138,30 +134,46 @@ class TestSolverBasicCases:
         assert cube.is_solved()
 
 
+class TestTranspositionTable:
+    """Test the transposition table used by IDA*."""
+    
+    def test_probe_covers_stored_depth(self) -> None:
+        """Test a stored entry covers its depth and shallower ones only."""
+        tt = TranspositionTable(size_log2=8)
+        h = Cube().zhash
+        
+        assert not tt.probe(h, 1)
+        tt.store(h, 3)
+        
+        assert tt.probe(h, 3)
+        assert tt.probe(h, 2)
+        assert not tt.probe(h, 4)
+    
+    def test_collision_keeps_deeper_entry(self) -> None:
+        """Test a shallower entry does not evict a deeper one in the same slot."""
+        tt = TranspositionTable(size_log2=4)
+        tt.store(0x10, 5)
+        tt.store(0x20, 2)  # same slot (low 4 bits are zero)
+        
+        assert tt.probe(0x10, 5)
+        assert not tt.probe(0x20, 2)
+
+
+@pytest.mark.slow
 class TestSolverDifferentHeuristics:
     """Test IDA* with different heuristics."""
     
-    def test_misplaced_heuristic(self) -> None:
+    def test_misplaced_heuristic(self, ur_scrambled_state: str, solve_cached: Any) -> None:
         """Test IDA* with misplaced heuristic."""
-        solver = IDASolver(heuristic='misplaced')
-        cube = Cube()
-        cube.move_U()
-        cube.move_R()
-        
-        moves, nodes = solver.solve(cube)
+        moves, nodes = solve_cached(IDASolver(heuristic='misplaced'), ur_scrambled_state)
         
         # Should find a solution
         assert len(moves) > 0
         assert nodes > 0
     
-    def test_wrong_face_heuristic(self) -> None:
+    def test_wrong_face_heuristic(self, ur_scrambled_state: str, solve_cached: Any) -> None:
         """Test IDA* with wrong_face heuristic."""
-        solver = IDASolver(heuristic='wrong_face')
-        cube = Cube()
-        cube.move_U()
-        cube.move_R()
-        
-        moves, nodes = solver.solve(cube)
+        moves, nodes = solve_cached(IDASolver(heuristic='wrong_face'), ur_scrambled_state)
         
         # Should find a solution
         assert len(moves) > 0
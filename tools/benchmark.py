@@ -7,27 +7,125 @@ import json
 import time
 import random
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from cube.cube import Cube
-from cube.moves import MoveCommand
+from cube.cube import Cube, MOVE_NAMES
+from cube.moves import parse_moves
 from solvers.bfs_solver import BFSSolver
 from solvers.ida_solver import IDASolver
 from solvers.kociemba_wrapper import KociembaWrapper
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False  # type: ignore
+
+
+def _apply_scramble(cube: Cube, scramble: list[str]) -> None:
+    """
+    Apply a list of move names to a cube in one kernel call.
+    
+    Args:
+        cube (Cube): Cube to scramble in place.
+        scramble (list[str]): Move names to apply.
+    
+    Raises:
+        ValueError: If any move name is not recognized.
+    """
+    cube.apply_sequence(parse_moves(scramble))
+
+
+def _solver_spec(solver: Any) -> tuple[type, dict[str, Any]]:
+    """Class and constructor arguments that rebuild ``solver`` in a worker process."""
+    if isinstance(solver, IDASolver):
+        return IDASolver, {'heuristic': solver.heuristic_type}
+    if isinstance(solver, KociembaWrapper):
+        return KociembaWrapper, {'fallback_to_ida': solver.fallback_to_ida}
+    return type(solver), {}
+
+
+# Solver classes that already ran an untimed solve in this process.
+_WARMED_UP: set[type] = set()
+
+
+def _warm_up(solver: Any) -> None:
+    """
+    Run one untimed solve per solver class and process.
+    
+    The first solve in a fresh worker pays for loading compiled kernels and
+    allocating search tables; keeping that out of the timed trials stops it
+    from skewing short scrambles.
+    
+    Args:
+        solver: Solver instance to warm up.
+    """
+    if type(solver) in _WARMED_UP:
+        return
+    cube = Cube()
+    _apply_scramble(cube, ['R'])
+    try:
+        solver.solve(cube)
+    except Exception:
+        pass  # A failing solver is reported by the timed trial instead
+    _WARMED_UP.add(type(solver))
+
+
+def _run_single_trial(
+    solver_cls: type,
+    solver_kwargs: dict[str, Any],
+    scramble: list[str]
+) -> dict[str, Any]:
+    """
+    Scramble a fresh cube and time one solve.
+    
+    Runs in a worker process, so the solver is constructed here rather than
+    pickled from the parent.
+    
+    Args:
+        solver_cls (type): Solver class.
+        solver_kwargs (dict[str, Any]): Arguments for the solver constructor.
+        scramble (list[str]): Move names to scramble with.
+    
+    Returns:
+        dict[str, Any]: Trial result.
+    """
+    solver = solver_cls(**solver_kwargs)
+    _warm_up(solver)
+    cube = Cube()
+    _apply_scramble(cube, scramble)
+    
+    # Monotonic, high-resolution clock; time.time() is too coarse for fast solves.
+    start_ns = time.perf_counter_ns()
+    try:
+        moves, nodes_explored = solver.solve(cube)
+        return {
+            'scramble': scramble,
+            'num_moves': len(moves),
+            'time_seconds': (time.perf_counter_ns() - start_ns) / 1e9,
+            'nodes_explored': nodes_explored,
+            'success': True
+        }
+    except Exception as e:
+        return {
+            'scramble': scramble,
+            'error': str(e),
+            'time_seconds': (time.perf_counter_ns() - start_ns) / 1e9,
+            'success': False
+        }
+
 
 class BenchmarkRunner:
     """
     Benchmark runner for Rubik's Cube solvers.
     """
     
-    ALL_MOVES = ['U', 'U\'', 'U2', 'D', 'D\'', 'D2',
-                 'L', 'L\'', 'L2', 'R', 'R\'', 'R2',
-                 'F', 'F\'', 'F2', 'B', 'B\'', 'B2']
+    ALL_MOVES = tuple(MOVE_NAMES)
     
     def __init__(self, seed: int = 42) -> None:
         """
@@ -37,7 +135,7 @@ class BenchmarkRunner:
             seed (int): Random seed for reproducibility.
         """
         self.seed = seed
-        random.seed(seed)
+        self.rng = random.Random(seed)
     
     def generate_scramble(self, num_moves: int = 10) -> list[str]:
         """
@@ -49,10 +147,7 @@ class BenchmarkRunner:
         Returns:
             list[str]: List of move names.
         """
-        scramble: list[str] = []
-        for _ in range(num_moves):
-            scramble.append(random.choice(self.ALL_MOVES))
-        return scramble
+        return self.rng.choices(self.ALL_MOVES, k=num_moves)
     
     def apply_scramble(self, cube: Cube, scramble: list[str]) -> None:
         """
@@ -62,23 +157,36 @@ class BenchmarkRunner:
             cube (Cube): The cube to scramble.
             scramble (list[str]): List of moves.
         """
-        cmd = MoveCommand(cube)
-        for move in scramble:
-            cmd.execute(move)
+        _apply_scramble(cube, scramble)
     
     def benchmark_solver(
         self,
         solver: Any,
         num_trials: int = 5,
-        scramble_depth: int = 10
+        scramble_depth: int = 10,
+        executor: Optional[Executor] = None,
+        keep_trials: bool = True,
+        workers: int = 1
     ) -> dict[str, Any]:
         """
         Benchmark a single solver.
         
+        Trials are independent, so they can run in parallel worker processes;
+        with a single worker they run inline in this process.
+        Each worker holds its own solver tables (IDA* allocates a ~40 MB
+        transposition table per solve, on top of ~100 MB of interpreter and
+        NumPy/Numba state), so size ``workers`` to the available memory.
+        
         Args:
             solver: The solver to benchmark.
             num_trials (int): Number of trials to run.
             scramble_depth (int): Number of moves in each scramble.
+            executor (Executor, optional): Pool to run trials on. If omitted,
+                a pool of ``workers`` processes is created for this call
+                (none when ``workers`` is 1).
+            keep_trials (bool): Store every trial in ``results['trials']``.
+                When False only the aggregate stats are returned.
+            workers (int): Worker processes when no executor is given.
         
         Returns:
             dict[str, Any]: Benchmark results.
@@ -87,57 +195,62 @@ class BenchmarkRunner:
             'solver': solver.__class__.__name__,
             'num_trials': num_trials,
             'scramble_depth': scramble_depth,
-            'trials': []
         }
+        if keep_trials:
+            results['trials'] = []
         
-        for trial_idx in range(num_trials):
-            print(f"  Trial {trial_idx + 1}/{num_trials}...", end=' ', flush=True)
-            
-            # Generate scramble
-            scramble = self.generate_scramble(scramble_depth)
-            cube = Cube()
-            self.apply_scramble(cube, scramble)
-            
-            # Solve
-            start_time = time.time()
-            try:
-                moves, nodes_explored = solver.solve(cube)
-                elapsed = time.time() - start_time
-                
-                trial_result: dict[str, Any] = {
-                    'scramble': scramble,
-                    'num_moves': len(moves),
-                    'time_seconds': elapsed,
-                    'nodes_explored': nodes_explored,
-                    'success': True
-                }
-                results['trials'].append(trial_result)
-                print(f"{elapsed:.4f}s, {len(moves)} moves")
-            except Exception as e:
-                elapsed = time.time() - start_time
-                trial_result = {
-                    'scramble': scramble,
-                    'error': str(e),
-                    'time_seconds': elapsed,
-                    'success': False
-                }
-                results['trials'].append(trial_result)
-                print(f"FAILED: {e}")
+        # Scrambles come from this runner's RNG, so results stay reproducible
+        # no matter which worker solves which trial.
+        scrambles = [self.generate_scramble(scramble_depth) for _ in range(num_trials)]
+        solver_cls, solver_kwargs = _solver_spec(solver)
         
-        # Compute statistics
-        successful_trials: list[Any] = [t for t in results['trials'] if t['success']]
-        if successful_trials:
-            times: list[Any] = [t['time_seconds'] for t in successful_trials]
-            moves: list[Any] = [t['num_moves'] for t in successful_trials]
-            
+        # Running aggregates, updated as each trial completes.
+        ok_count = 0
+        sum_time, min_time, max_time = 0.0, float('inf'), 0.0
+        sum_moves, min_moves, max_moves = 0, None, 0
+        
+        pool = executor
+        if pool is None and workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            trial_args = ([solver_cls] * num_trials, [solver_kwargs] * num_trials, scrambles)
+            # A single worker gains nothing from a pool but process startup
+            # and pickling, so run the trials inline.
+            trials = (
+                pool.map(_run_single_trial, *trial_args) if pool is not None
+                else map(_run_single_trial, *trial_args)
+            )
+            for trial_idx, trial_result in enumerate(trials):
+                if keep_trials:
+                    results['trials'].append(trial_result)
+                if trial_result['success']:
+                    elapsed = trial_result['time_seconds']
+                    num_moves = trial_result['num_moves']
+                    ok_count += 1
+                    sum_time += elapsed
+                    min_time = min(min_time, elapsed)
+                    max_time = max(max_time, elapsed)
+                    sum_moves += num_moves
+                    min_moves = num_moves if min_moves is None else min(min_moves, num_moves)
+                    max_moves = max(max_moves, num_moves)
+                    print(f"  Trial {trial_idx + 1}/{num_trials}... "
+                          f"{elapsed:.4f}s, {num_moves} moves")
+                else:
+                    print(f"  Trial {trial_idx + 1}/{num_trials}... "
+                          f"FAILED: {trial_result['error']}")
+        finally:
+            if executor is None and pool is not None:
+                pool.shutdown()
+        
+        if ok_count:
             results['stats'] = {
-                'success_rate': len(successful_trials) / num_trials,
-                'avg_time_seconds': sum(times) / len(times),
-                'min_time_seconds': min(times),
-                'max_time_seconds': max(times),
-                'avg_solution_length': sum(moves) / len(moves),
-                'min_solution_length': min(moves),
-                'max_solution_length': max(moves),
+                'success_rate': ok_count / num_trials,
+                'avg_time_seconds': sum_time / ok_count,
+                'min_time_seconds': min_time,
+                'max_time_seconds': max_time,
+                'avg_solution_length': sum_moves / ok_count,
+                'min_solution_length': min_moves,
+                'max_solution_length': max_moves,
             }
         else:
             results['stats'] = {'success_rate': 0}
@@ -149,7 +262,9 @@ class BenchmarkRunner:
         solvers: list[Any],
         depths: list[int] | None = None,
         num_trials: int = 5,
-        output_file: str = 'benchmark_results.json'
+        output_file: str = 'benchmark_results.json',
+        summary_only: bool = False,
+        workers: int = 1
     ) -> None:
         """
         Run benchmark on multiple solvers and depths.
@@ -159,6 +274,10 @@ class BenchmarkRunner:
             depths (list[int]): Scramble depths to test. Defaults to [5, 8, 10].
             num_trials (int): Number of trials per configuration.
             output_file (str): Output JSON file.
+            summary_only (bool): Write only per-configuration stats, not
+                every trial's scramble and solution.
+            workers (int): Worker processes to run trials on (see
+                ``benchmark_solver`` for the per-worker memory cost).
         """
         if depths is None:
             depths = [5, 8, 10]
@@ -168,18 +287,30 @@ class BenchmarkRunner:
             'configurations': []
         }
         
-        for solver in solvers:
-            for depth in depths:
-                print(f"\nBenchmarking {solver.__class__.__name__} (depth={depth})...")
-                result = self.benchmark_solver(solver, num_trials, depth)
-                all_results['configurations'].append(result)
+        # One pool shared by every configuration; none for a single worker.
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for solver in solvers:
+                for depth in depths:
+                    print(f"\nBenchmarking {solver.__class__.__name__} (depth={depth})...")
+                    result = self.benchmark_solver(
+                        solver, num_trials, depth, executor,
+                        keep_trials=not summary_only, workers=workers
+                    )
+                    all_results['configurations'].append(result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         # Save results
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        if HAS_ORJSON:
+            output_path.write_bytes(orjson.dumps(all_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(all_results, f, indent=2)
         
         print(f"\n✓ Benchmark complete. Results saved to {output_file}")
         self._print_summary(all_results)
@@ -236,6 +367,17 @@ def main():
         default='ida',
         help='Which solvers to benchmark (default: ida)'
     )
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for trials; each needs a few hundred MB (default: 1)'
+    )
+    parser.add_argument(
+        '--summary-only',
+        action='store_true',
+        help='Only save aggregate stats, not individual trials'
+    )
     parser.add_argument(
         '--seed',
         type=int,
@@ -260,7 +402,9 @@ def main():
         solvers_to_test,
         depths=args.depths,
         num_trials=args.trials,
-        output_file=args.output
+        output_file=args.output,
+        summary_only=args.summary_only,
+        workers=args.workers
     )
 
 
@@ -3,10 +3,39 @@ Flask web application for Rubik's Cube solver visualization.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
 import os
 from flask import Flask, render_template, jsonify, request  # type: ignore
+from flask.json.provider import DefaultJSONProvider  # type: ignore
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Imported at startup so the first /api/solve request doesn't pay for it
+from cube.cube import Cube, COLORS
+from solvers.ida_solver import IDASolver
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False  # type: ignore
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes and parses with orjson."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string (formatting kwargs are ignored)."""
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Parse a JSON string or bytes."""
+        return orjson.loads(s)
+
 
 # Get the directory where this file is located
 basedir = os.path.abspath(os.path.dirname(__file__))
@@ -19,7 +48,24 @@ app: Flask = Flask(
     template_folder=template_dir,
     static_folder=static_dir
 )
-app.config["JSON_SORT_KEYS"] = False
+# Static assets don't change while the server runs; let browsers keep them.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
+# Flask 2.2+ (the minimum supported) reads these from the JSON provider;
+# the old JSON_SORT_KEYS-style config keys are deprecated and gone in 2.3.
+# Compact even in debug mode, unsorted, and no \u escapes.
+app.json.sort_keys = False  # type: ignore[attr-defined]
+app.json.compact = True  # type: ignore[attr-defined]
+app.json.ensure_ascii = False  # type: ignore[attr-defined]
+
+# Deletes every valid color letter; anything left over is invalid input.
+_STRIP_COLORS = str.maketrans("", "", COLORS)
+
+# (key, data) of the last parsed solution.json, keyed by the file's
+# (mtime_ns, size). Always replaced as one tuple so readers never see a new
+# key paired with old data.
+_solution_cache: Tuple[Any, Any] = (None, None)
 
 
 @app.route("/")  # type: ignore
@@ -39,13 +85,24 @@ def get_solution() -> Union[Dict[str, Any], Tuple[Dict[str, Any], int]]:
     Returns:
         Union[Dict, Tuple]: Solution data or error response with 404 status
     """
+    global _solution_cache
     solution_file = Path("solution.json")
-    if not solution_file.exists():
+    try:
+        stat = solution_file.stat()
+    except FileNotFoundError:
         return jsonify({"error": "No solution found"}), 404
     
     try:
-        with open(solution_file, "r") as f:
-            data: Dict[str, Any] = json.load(f)
+        # Re-read and re-parse only when the file changed since the last hit
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached_key, data = _solution_cache
+        if cached_key != key:
+            if HAS_ORJSON:
+                data = orjson.loads(solution_file.read_bytes())
+            else:
+                with open(solution_file, "r") as f:
+                    data = json.load(f)
+            _solution_cache = (key, data)
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -72,16 +129,11 @@ def solve_cube() -> Union[Dict[str, Any], Tuple[Dict[str, Any], int]]:
                 "error": f"Invalid cube state length: {len(cube_state)}. Expected 54 characters."
             }), 400
         
-        valid_chars = set(['W', 'O', 'G', 'R', 'B', 'Y'])
-        for char in cube_state:
-            if char not in valid_chars:
-                return jsonify({
-                    "error": f"Invalid character: {char}. Use only W, O, G, R, B, Y"
-                }), 400
-        
-        # Import solver
-        from solvers.ida_solver import IDASolver
-        from cube.cube import Cube
+        invalid = cube_state.translate(_STRIP_COLORS)
+        if invalid:
+            return jsonify({
+                "error": f"Invalid character: {invalid[0]}. Use only W, O, G, R, B, Y"
+            }), 400
         
         # Create and solve cube
         cube = Cube(cube_state)